@@ -11,441 +11,491 @@ Uses python-chess types directly:
 - chess.PAWN/KNIGHT/BISHOP/ROOK/QUEEN/KING (integers 1-6)
 """
 
-from typing import Optional, List, Tuple
-import copy
-import io
+from typing import Optional, List, Tuple, Dict
+from collections import OrderedDict, namedtuple
 import chess
 import chess.pgn
 from config import GameConstants
 
 
+def _north_fill(bb: chess.Bitboard) -> chess.Bitboard:
+    """Smear every set bit towards rank 8"""
+    # Bits pushed past rank 8 never shift back down, so one mask at the end is enough
+    bb |= bb << 8
+    bb |= bb << 16
+    bb |= bb << 32
+    return bb & chess.BB_ALL
+
+
+def _south_fill(bb: chess.Bitboard) -> chess.Bitboard:
+    """Smear every set bit towards rank 1"""
+    bb |= bb >> 8
+    bb |= bb >> 16
+    bb |= bb >> 32
+    return bb
+
+
+# Board halves: ranks 1-4 (squares 0-31) and ranks 5-8 (squares 32-63)
+_BB_WHITE_HALF = chess.BB_RANK_1 | chess.BB_RANK_2 | chess.BB_RANK_3 | chess.BB_RANK_4
+_BB_BLACK_HALF = chess.BB_ALL & ~_BB_WHITE_HALF
+
+
+def _beyond_table() -> List[List[chess.Bitboard]]:
+    """[a][b] -> squares on the line from a through b that lie strictly past b (0 if not aligned)"""
+    table = [[0] * 64 for _ in chess.SQUARES]
+    for a in chess.SQUARES:
+        for b in chess.SQUARES:
+            ray = chess.BB_RAYS[a][b]
+            if not ray or a == b:
+                continue
+            # Squares along a line are ordered by index, so "past b" is a one-sided index range
+            if b > a:
+                table[a][b] = ray & ~((chess.BB_SQUARES[b] << 1) - 1)
+            else:
+                table[a][b] = ray & (chess.BB_SQUARES[b] - 1)
+    return table
+
+
+_BB_BEYOND = _beyond_table()
+
+
+def _piece_attacks(piece_type: chess.PieceType, color: chess.Color,
+                   square: chess.Square, occupied: chess.Bitboard) -> chess.Bitboard:
+    """Squares a piece would attack from square given an arbitrary occupancy"""
+    if piece_type == chess.PAWN:
+        return chess.BB_PAWN_ATTACKS[color][square]
+    if piece_type == chess.KNIGHT:
+        return chess.BB_KNIGHT_ATTACKS[square]
+    if piece_type == chess.KING:
+        return chess.BB_KING_ATTACKS[square]
+    attacks = 0
+    if piece_type in (chess.BISHOP, chess.QUEEN):
+        attacks = chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+    if piece_type in (chess.ROOK, chess.QUEEN):
+        attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                    chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+    return attacks
+
+
+# Analysis sections - bit flags for BoardState._ensure_analysis()
+ANALYSIS_HANGING = 1 << 0  # attacked + hanging pieces
+ANALYSIS_PINS = 1 << 1
+ANALYSIS_SKEWERS = 1 << 2
+ANALYSIS_PAWNS = 1 << 3    # doubled, isolated, passed, backward
+ANALYSIS_FORKS = 1 << 4
+ANALYSIS_ALL = (ANALYSIS_HANGING | ANALYSIS_PINS | ANALYSIS_SKEWERS |
+                ANALYSIS_PAWNS | ANALYSIS_FORKS)
+
+# Analysis entries filled by the ANALYSIS_PAWNS section (and shared through the pawn cache)
+_PAWN_PATTERNS = ('doubled', 'isolated', 'passed', 'backward')
+
+# Starting piece counts (excluding kings), highest piece type first
+_STARTING_COUNTS = ((chess.QUEEN, 1), (chess.ROOK, 2), (chess.BISHOP, 2),
+                    (chess.KNIGHT, 2), (chess.PAWN, 8))
+
+# Castling rights snapshot returned by BoardState.castling_rights
+CastlingRights = namedtuple('CastlingRights',
+                            'white_kingside white_queenside black_kingside black_queenside')
+
+
 class BoardState:
     """
     Chess board state with tactical analysis helpers.
     Wraps python-chess Board with additional functionality.
     """
 
-    def __init__(self):
-        """Initialize with standard starting position"""
-        self.board = chess.Board()
+    # Fixed attribute layout - no per-instance __dict__
+    __slots__ = ('board', 'is_check', 'is_in_checkmate', 'is_in_stalemate', 'redo_stack',
+                 '_analysis', '_analysis_cache', '_pawn_cache', '_castling_cache', '_castling_key',
+                 '_legal_moves_key', '_legal_moves_by_from')
+
+    def __init__(self, board: Optional[chess.Board] = None):
+        """Initialize with standard starting position, or adopt an existing board"""
+        self.board = board if board is not None else chess.Board()
 
         # Game status flags
         self.is_check = False
         self.is_in_checkmate = False
         self.is_in_stalemate = False
 
-        # Move history tracking
-        self.move_history: List[chess.Move] = []
-        self.last_move: Optional[chess.Move] = None
-
-
-        # Undo/redo stacks - store board copies
-        self.undo_stack: List[Tuple[chess.Board, List[chess.Move], Optional[chess.Move]]] = []
-        self.redo_stack: List[Tuple[chess.Board, List[chess.Move], Optional[chess.Move]]] = []
+        # Undo/redo journal - the board's own move stack is the undo side,
+        # undone moves wait here until redone or discarded by a new move
+        self.redo_stack: List[chess.Move] = []
 
         # Mega-loop analysis cache - computed lazily on first access
+        # LRU keyed by position so revisiting a node (undo/redo, PGN jumps) skips recomputation
         self._analysis: Optional[dict] = None
-        self._analysis_valid = False
+        self._analysis_cache: 'OrderedDict[tuple, list]' = OrderedDict()
+
+        # Pawn-structure results depend only on where the pawns stand, so they are cached
+        # per (white pawns, black pawns) and survive every move that leaves the pawns alone
+        self._pawn_cache: 'OrderedDict[Tuple[int, int], tuple]' = OrderedDict()
+
+        # Castling rights cache - rebuilt only when rights or king/rook placement change
+        self._castling_cache: Optional[CastlingRights] = None
+        self._castling_key: Optional[tuple] = None
+
+        # Legal moves grouped by origin square - generated once per position
+        self._legal_moves_key: Optional[tuple] = None
+        self._legal_moves_by_from: Dict[chess.Square, List[chess.Move]] = {}
 
         self._update_game_status()
 
     @property
-    def castling_rights(self):
+    def move_history(self) -> List[chess.Move]:
+        """Moves played since the root position (the board's own move stack)"""
+        return self.board.move_stack
+
+    @property
+    def last_move(self) -> Optional[chess.Move]:
+        """Most recent move, or None at the root position"""
+        return self.board.move_stack[-1] if self.board.move_stack else None
+
+    @property
+    def undo_stack(self) -> List[chess.Move]:
+        """Moves that can be undone, most recent last"""
+        return self.board.move_stack
+
+    @property
+    def castling_rights(self) -> CastlingRights:
         """Get castling rights as a named tuple-like object for test compatibility"""
-        class CastlingRights:
-            def __init__(self, board):
-                self.white_kingside = board.has_kingside_castling_rights(chess.WHITE)
-                self.white_queenside = board.has_queenside_castling_rights(chess.WHITE)
-                self.black_kingside = board.has_kingside_castling_rights(chess.BLACK)
-                self.black_queenside = board.has_queenside_castling_rights(chess.BLACK)
-        return CastlingRights(self.board)
+        # Effective rights depend on the raw rights plus where kings and rooks stand
+        board = self.board
+        key = (board.castling_rights, board.kings, board.rooks, board.occupied_co[chess.WHITE])
+        if key != self._castling_key:
+            self._castling_cache = CastlingRights(
+                board.has_kingside_castling_rights(chess.WHITE),
+                board.has_queenside_castling_rights(chess.WHITE),
+                board.has_kingside_castling_rights(chess.BLACK),
+                board.has_queenside_castling_rights(chess.BLACK))
+            self._castling_key = key
+        return self._castling_cache
 
     # ========== MEGA-LOOP ANALYSIS INFRASTRUCTURE ==========
 
+    def position_key(self) -> Tuple:
+        """Hashable key identifying the current position (placement, side to move, castling, en passant)"""
+        # Built from public Board attributes only; ep_square is kept even when the capture
+        # is illegal, because fork detection treats it as a pawn target
+        board = self.board
+        return (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings,
+                board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK],
+                board.turn, board.castling_rights, board.ep_square)
+
     def _invalidate_analysis(self) -> None:
         """Invalidate cached analysis after position changes"""
-        self._analysis_valid = False
-
-    def _ensure_analysis(self) -> None:
-        """Compute analysis if not already cached (lazy evaluation)"""
-        if not self._analysis_valid:
-            self._analysis = self._compute_board_analysis()
-            self._analysis_valid = True
-
-    def _compute_board_analysis(self) -> dict:
-        """
-        Mega-loop: Single-pass bitboard-optimized board analysis.
-        Computes all tactical patterns in one iteration through occupied squares.
-
-        Performance: ~2-3x baseline cost for complete tactical analysis.
-        Uses python-chess SquareSet (bitboard wrapper) for O(1) operations.
-        """
-        analysis = {
-            # SECTION 1: Initialize storage
+        # No-op: the cache is keyed by position, so a changed board simply misses
+        pass
+
+    def _ensure_analysis(self, sections: int = ANALYSIS_ALL) -> None:
+        """Compute the requested analysis sections if not already cached (lazy evaluation)"""
+        key = self.position_key()
+        entry = self._analysis_cache.get(key)
+        if entry is None:
+            # Entry is [bitmask of computed sections, analysis dict]
+            entry = [0, self._new_analysis()]
+            self._analysis_cache[key] = entry
+            if len(self._analysis_cache) > GameConstants.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(key)
+
+        missing = sections & ~entry[0]
+        if missing:
+            self._compute_board_analysis(entry[1], missing)
+            entry[0] |= missing
+        self._analysis = entry[1]
+
+    @staticmethod
+    def _new_analysis() -> dict:
+        """Empty analysis storage, filled section by section"""
+        # Per-color results are ([black], [white]) pairs, indexed directly by chess.BLACK/chess.WHITE
+        return {
             # Hanging pieces (used by: get_hanging_pieces, hanging piece indicator)
-            'white_hanging': [],
-            'black_hanging': [],
-            # Attacked pieces (used by: count_attacked_pieces, attacked indicator)
-            'white_attacked': [],
-            'black_attacked': [],
+            # BITBOARD: [black, white] masks, so counts are popcounts and lookups a single AND
+            'hanging': [0, 0],
+            # Attacked pieces (used by: get_attacked_pieces, attacked indicator)
+            'attacked': [0, 0],
             # Pinned pieces (used by: get_pinned_pieces, pin indicator)
-            'white_pinned': [],
-            'black_pinned': [],
+            'pinned': [0, 0],
             # Skewered pieces (used by: get_skewered_pieces, skewer indicator)
-            'white_skewered': [],
-            'black_skewered': [],
+            'skewered': [0, 0],
             # Fork opportunities (used by: get_fork_opportunities, fork visualization)
             # Format: list of dicts with {origin: square, destination: square, forked_pieces: [squares]}
-            'white_forks': [],
-            'black_forks': [],
+            'forks': ([], []),
             # Pawn patterns (used by: pawn statistics display)
-            'white_isolated': [],
-            'black_isolated': [],
-            'white_doubled': [],
-            'black_doubled': [],
-            'white_passed': [],
-            'black_passed': [],
-            'white_backward': [],
-            'black_backward': [],
+            'isolated': ([], []),
+            'doubled': ([], []),
+            'passed': ([], []),
+            'backward': ([], []),
+            # Activity scores (used by: get_activity_scores, statistics panel)
+            # (white, black) or None until first requested
+            'activity': None,
+            # Reachable-square bitboards (used by: get_reachable_squares, activity hover)
+            # Indexed by color, None until first requested
+            'reachable': [None, None],
+            # Defender lookups (used by: _get_attackers_if_empty, attacker/defender hover)
+            # Keyed by (square, color), filled on demand
+            'defenders': {},
         }
 
+    def _compute_board_analysis(self, analysis: dict, sections: int = ANALYSIS_ALL) -> None:
+        """
+        Mega-loop: Bitboard-optimized board analysis, split into independent sections.
+        Only the sections flagged in the bitmask are computed, so callers pay only for what they read.
+
+        Performance: ~2-3x baseline cost for complete tactical analysis.
+        Each section works on the raw integer bitboards, snapshotted into locals up front.
+        """
+        # SECTION 1: Storage is created by _new_analysis()
         # SECTION 2: Basic piece information + hanging/attacked detection
+        if sections & ANALYSIS_HANGING:
+            self._compute_hanging(analysis)
+        # SECTION 3: Pins and skewers
+        if sections & ANALYSIS_PINS:
+            self._compute_pins(analysis)
+        if sections & ANALYSIS_SKEWERS:
+            self._compute_skewers(analysis)
+        # SECTION 4: Pawn patterns
+        if sections & ANALYSIS_PAWNS:
+            self._compute_pawn_patterns(analysis)
+        # SECTION 5: Forks
+        if sections & ANALYSIS_FORKS:
+            self._compute_forks(analysis)
+
+    def _compute_hanging(self, analysis: dict) -> None:
+        """Fill attacked/hanging pieces for both colors"""
+        board = self.board
+        occupied = board.occupied
+        occupied_co = board.occupied_co
+
         # BITBOARD: Iterate only occupied squares (~25 pieces) instead of all 64
-        for square in chess.SquareSet(self.board.occupied):
-            piece = self.board.piece_at(square)
-            if not piece:
-                continue
+        # Hot-loop lookups bound once: attack query, square table and result lists
+        attackers_mask = board.attackers_mask
+        bb_squares = chess.BB_SQUARES
+        attacked, hanging = analysis['attacked'], analysis['hanging']
+        white_bb = occupied_co[chess.WHITE]
+        for square in chess.scan_forward(occupied):
+            color = bool(white_bb & bb_squares[square])
 
-            enemy_color = not piece.color
+            # BITBOARD: attackers_mask() returns a raw int - no SquareSet allocation
+            attackers_bb = attackers_mask(not color, square)
 
-            # BITBOARD: attackers() returns SquareSet (bitboard wrapper)
-            # Keep as SquareSet - don't convert to Python set!
-            attackers = self.board.attackers(enemy_color, square)
-            defenders = self.board.attackers(piece.color, square)
-
-            # Check if attacked (len on SquareSet is O(1) popcount)
-            if len(attackers) > 0:
-                if piece.color == chess.WHITE:
-                    analysis['white_attacked'].append(square)
-                else:
-                    analysis['black_attacked'].append(square)
+            # Check if attacked (non-zero bitboard)
+            if attackers_bb:
+                attacked[color] |= bb_squares[square]
 
                 # Check if hanging (attacked AND not defended)
-                if len(defenders) == 0:
-                    if piece.color == chess.WHITE:
-                        analysis['white_hanging'].append(square)
-                    else:
-                        analysis['black_hanging'].append(square)
-
-        # SECTION 3: Pins and skewers
-        # Pin detection: Use built-in board.is_pinned() for efficiency
-        # Skewer detection: Custom implementation using BB_RAYS
-
-        # --- PIN DETECTION ---
-        # BITBOARD: Get all non-pawn pieces for both colors
-        white_pieces = chess.SquareSet(self.board.occupied_co[chess.WHITE])
-        black_pieces = chess.SquareSet(self.board.occupied_co[chess.BLACK])
+                if not attackers_mask(color, square):
+                    hanging[color] |= bb_squares[square]
+
+    def _compute_pins(self, analysis: dict) -> None:
+        """Fill absolutely and relatively pinned pieces for both colors"""
+        # Pin detection: Use built-in board.pin_mask() for absolute pins, rays for relative ones
+        board = self.board
+        occupied = board.occupied
+        occupied_co = board.occupied_co
+        pawns = board.pawns
+
+        # Hot-loop lookups bound once: piece values indexed by piece type, table/method aliases
+        piece_values = GameConstants.PIECE_VALUES
+        piece_type_at = board.piece_type_at
+        beyond = _BB_BEYOND
+
+        # BITBOARD: Sliding pieces (B/R/Q) per color - only they can pin or skewer
+        sliders = board.bishops | board.rooks | board.queens
+        sliders_by_color = (sliders & occupied_co[chess.BLACK],
+                            sliders & occupied_co[chess.WHITE])
 
-        white_non_pawn = white_pieces & ~chess.SquareSet(self.board.pawns)
-        black_non_pawn = black_pieces & ~chess.SquareSet(self.board.pawns)
-
-        # --- PIN DETECTION ---
         # Detect both absolute pins (to king) and relative pins (to valuable pieces)
+        pinned = analysis['pinned']
+        bb_squares = chess.BB_SQUARES
         for color in [chess.WHITE, chess.BLACK]:
             enemy_color = not color
-            color_pieces = white_pieces if color == chess.WHITE else black_pieces
-
-            # Get enemy sliding pieces (B/R/Q can create pins)
-            enemy_sliding_pieces = chess.SquareSet(self.board.occupied_co[enemy_color]) & (
-                chess.SquareSet(self.board.bishops) |
-                chess.SquareSet(self.board.rooks) |
-                chess.SquareSet(self.board.queens)
-            )
-
-            for attacker_square in enemy_sliding_pieces:
-                # Get all squares this sliding piece attacks
-                attacked_squares = self.board.attacks(attacker_square)
+            color_non_pawn = occupied_co[color] & ~pawns
 
-                # Check each attacked piece of our color
-                for attacked_square in (attacked_squares & color_pieces):
-                    attacked_piece = self.board.piece_at(attacked_square)
+            # Get enemy sliding pieces (B/R/Q can create pins) - none means no pins
+            enemy_sliders = sliders_by_color[enemy_color]
+            if not enemy_sliders:
+                continue
 
-                    # Skip pawns (not considered pinnable for display purposes)
-                    if attacked_piece.piece_type == chess.PAWN:
+            for attacked_square in chess.scan_forward(color_non_pawn):
+                # Absolute pins: python-chess already knows the king's pin rays
+                if board.pin_mask(color, attacked_square) != chess.BB_ALL:
+                    pinned[color] |= bb_squares[attacked_square]
+                    continue
+
+                # Relative pins: a more valuable piece directly behind the attacked piece
+                front_value = piece_values[piece_type_at(attacked_square)]
+                for attacker_square in chess.scan_forward(
+                        board.attackers_mask(enemy_color, attacked_square) & enemy_sliders):
+                    # BITBOARD: Occupied squares beyond the attacked piece; the nearest one is the
+                    # lowest index when the ray runs upwards, the highest when it runs downwards
+                    blockers = beyond[attacker_square][attacked_square] & occupied
+                    if not blockers:
+                        continue
+                    behind_square = chess.lsb(blockers) if attacked_square > attacker_square else chess.msb(blockers)
+                    if not occupied_co[color] & chess.BB_SQUARES[behind_square]:
                         continue
 
-                    # Get ray from attacker through attacked piece
-                    ray = chess.BB_RAYS[attacker_square][attacked_square]
-                    if ray:
-                        # Look for valuable pieces behind the attacked piece on the same ray
-                        for behind_square in chess.SquareSet(ray):
-                            # Skip the attacker and attacked squares
-                            if behind_square in (attacker_square, attacked_square):
-                                continue
-
-                            # Only check squares beyond the attacked piece
-                            if chess.square_distance(attacker_square, behind_square) <= \
-                               chess.square_distance(attacker_square, attacked_square):
-                                continue
-
-                            behind_piece = self.board.piece_at(behind_square)
-
-                            # Found a piece behind?
-                            if behind_piece and behind_piece.color == color:
-                                # Check if it's a valid pin (behind piece must be king or higher value)
-                                behind_value = GameConstants.PIECE_VALUES[behind_piece.piece_type]
-                                front_value = GameConstants.PIECE_VALUES[attacked_piece.piece_type]
-
-                                is_pin = (behind_piece.piece_type == chess.KING or
-                                         behind_value > front_value)
-
-                                if is_pin:
-                                    # Verify no pieces between front and back
-                                    between_squares = chess.SquareSet(chess.between(attacked_square, behind_square))
-                                    if not any(self.board.piece_at(sq) for sq in between_squares):
-                                        # Valid pin detected!
-                                        if color == chess.WHITE:
-                                            analysis['white_pinned'].append(attacked_square)
-                                        else:
-                                            analysis['black_pinned'].append(attacked_square)
-                                        break  # Only need first pin on this ray
-
-        # --- SKEWER DETECTION ---
-        # Process both colors
+                    # Check if it's a valid pin (behind piece must be king or higher value)
+                    behind_type = piece_type_at(behind_square)
+                    if behind_type == chess.KING or piece_values[behind_type] > front_value:
+                        pinned[color] |= bb_squares[attacked_square]
+
+    def _compute_skewers(self, analysis: dict) -> None:
+        """Fill skewered pieces for both colors"""
+        # Skewer detection: X-ray attacks through the front piece
+        board = self.board
+        occupied = board.occupied
+        occupied_co = board.occupied_co
+        pawns = board.pawns
+
+        # Hot-loop lookups bound once: piece values indexed by piece type, table/method aliases
+        piece_values = GameConstants.PIECE_VALUES
+        piece_type_at = board.piece_type_at
+        between = chess.between
+
+        # BITBOARD: Sliding pieces (B/R/Q) per color - only they can pin or skewer
+        sliders = board.bishops | board.rooks | board.queens
+        sliders_by_color = (sliders & occupied_co[chess.BLACK],
+                            sliders & occupied_co[chess.WHITE])
+
+        # BITBOARD: X-ray attacks - lift the front pieces off the board and see what the
+        # slider hits next; a skewer needs both the front and back piece to be non-pawns
+        skewered = analysis['skewered']
+        bb_squares = chess.BB_SQUARES
         for color in [chess.WHITE, chess.BLACK]:
             enemy_color = not color
-            color_pieces = white_pieces if color == chess.WHITE else black_pieces
-
-            # BITBOARD: Get only enemy sliding pieces (B/R/Q can create skewers)
-            enemy_sliding_pieces = chess.SquareSet(self.board.occupied_co[enemy_color]) & (
-                chess.SquareSet(self.board.bishops) |
-                chess.SquareSet(self.board.rooks) |
-                chess.SquareSet(self.board.queens)
-            )
-
-            for attacker_square in enemy_sliding_pieces:
-                # Get all squares this sliding piece attacks
-                attacked_squares = self.board.attacks(attacker_square)
-
-                # Check each attacked piece of our color
-                for attacked_square in (attacked_squares & color_pieces):
-                    attacked_piece = self.board.piece_at(attacked_square)
-
-                    # Skip pawns (not considered skewerable)
-                    if attacked_piece.piece_type == chess.PAWN:
-                        continue
-
-                    # BITBOARD: Get full ray between attacker and attacked piece (O(1))
-                    ray = chess.BB_RAYS[attacker_square][attacked_square]
-                    if ray:  # Non-zero bitboard means there's a ray between these squares
-
-                        # Look for pieces behind the attacked piece on the same ray
-                        for behind_square in chess.SquareSet(ray):
-                            # Skip the attacker and attacked squares
-                            if behind_square in (attacker_square, attacked_square):
-                                continue
-
-                            # Only check squares beyond the attacked piece
-                            if chess.square_distance(attacker_square, behind_square) <= \
-                               chess.square_distance(attacker_square, attacked_square):
-                                continue
-
-                            behind_piece = self.board.piece_at(behind_square)
-
-                            # Found a piece behind?
-                            if behind_piece and behind_piece.color == color:
-                                # Skip if the behind piece is a pawn (too common, not tactically significant)
-                                if behind_piece.piece_type == chess.PAWN:
-                                    continue
-
-                                # Check if it's a valid skewer (front >= back in value)
-                                # OR if front piece is king (absolute skewer)
-                                front_value = GameConstants.PIECE_VALUES[attacked_piece.piece_type]
-                                back_value = GameConstants.PIECE_VALUES[behind_piece.piece_type]
-
-                                is_skewer = (front_value >= back_value or
-                                           attacked_piece.piece_type == chess.KING)
-
-                                if is_skewer:
-                                    # BITBOARD: Verify no pieces between front and back (O(1))
-                                    between_squares = chess.SquareSet(chess.between(attacked_square, behind_square))
-                                    if not any(self.board.piece_at(sq) for sq in between_squares):
-                                        # Valid skewer detected!
-                                        if color == chess.WHITE:
-                                            analysis['white_skewered'].append(attacked_square)
-                                        else:
-                                            analysis['black_skewered'].append(attacked_square)
-                                        break  # Only need first skewer on this ray
+            own_non_pawn = occupied_co[color] & ~pawns
 
-        # SECTION 4: Pawn patterns
-        # BITBOARD: Get pawn bitboards for both colors
-        white_pawns = chess.SquareSet(self.board.pawns & self.board.occupied_co[chess.WHITE])
-        black_pawns = chess.SquareSet(self.board.pawns & self.board.occupied_co[chess.BLACK])
-
-        # File masks for bitboard operations (8 iterations, not 64!)
-        FILE_MASKS = [chess.BB_FILES[i] for i in range(8)]
-
-        # --- DOUBLED PAWNS (check each file) ---
-        for file_idx in range(8):
-            white_on_file = white_pawns & chess.SquareSet(FILE_MASKS[file_idx])
-            if len(white_on_file) > 1:
-                for square in white_on_file:
-                    analysis['white_doubled'].append(square)
+            # BITBOARD: Get only enemy sliding pieces (B/R/Q can create skewers) - none means no skewers
+            enemy_sliders = sliders_by_color[enemy_color]
+            if not enemy_sliders:
+                continue
 
-            black_on_file = black_pawns & chess.SquareSet(FILE_MASKS[file_idx])
-            if len(black_on_file) > 1:
-                for square in black_on_file:
-                    analysis['black_doubled'].append(square)
+            for attacker_square in chess.scan_forward(enemy_sliders):
+                attacks = board.attacks_mask(attacker_square)
+                front_bb = attacks & own_non_pawn
+                if not front_bb:
+                    continue
+
+                xray = _piece_attacks(piece_type_at(attacker_square), enemy_color,
+                                      attacker_square, occupied ^ front_bb) & ~attacks
+                back_bb = xray & own_non_pawn
+                if not back_bb:
+                    continue
+
+                for behind_square in chess.scan_forward(back_bb):
+                    # Exactly one front piece sits between the slider and each x-rayed square
+                    attacked_square = chess.lsb(between(attacker_square, behind_square) & front_bb)
+
+                    # Check if it's a valid skewer (front >= back in value)
+                    # OR if front piece is king (absolute skewer)
+                    front_type = piece_type_at(attacked_square)
+                    back_type = piece_type_at(behind_square)
+                    if (front_type == chess.KING or
+                            piece_values[front_type] >= piece_values[back_type]):
+                        skewered[color] |= bb_squares[attacked_square]
+
+    def _compute_pawn_patterns(self, analysis: dict) -> None:
+        """Fill doubled, isolated, passed and backward pawns for both colors"""
+        occupied_co = self.board.occupied_co
+        pawns = self.board.pawns
+
+        # BITBOARD: Whole-board shifts and fills on raw ints - no per-square loops
+        # and no SquareSet objects; results are unpacked with scan_forward
+        white_pawns = pawns & occupied_co[chess.WHITE]
+        black_pawns = pawns & occupied_co[chess.BLACK]
+
+        # Pawn hash: reuse the results of an identical pawn configuration
+        pawn_key = (white_pawns, black_pawns)
+        cached = self._pawn_cache.get(pawn_key)
+        if cached is not None:
+            self._pawn_cache.move_to_end(pawn_key)
+            for pattern, results in zip(_PAWN_PATTERNS, cached):
+                analysis[pattern] = results
+            return
+
+        # Front and rear spans: every square ahead of / behind each pawn on its own file.
+        # Fills commute with the sideways shifts, so four fills serve every pattern below.
+        white_north = _north_fill(chess.shift_up(white_pawns))
+        white_south = _south_fill(chess.shift_down(white_pawns))
+        black_north = _north_fill(chess.shift_up(black_pawns))
+        black_south = _south_fill(chess.shift_down(black_pawns))
+
+        # --- DOUBLED PAWNS ---
+        # A pawn is doubled if another friendly pawn sits ahead of or behind it on its file
+        analysis['doubled'][chess.WHITE].extend(chess.scan_forward(white_pawns & (white_north | white_south)))
+        analysis['doubled'][chess.BLACK].extend(chess.scan_forward(black_pawns & (black_north | black_south)))
 
         # --- ISOLATED PAWNS ---
-        for square in white_pawns:
-            file = chess.square_file(square)
-            # BITBOARD: Check adjacent files with bitboard operations
-            left_file = FILE_MASKS[file-1] if file > 0 else 0
-            right_file = FILE_MASKS[file+1] if file < 7 else 0
-            adjacent_mask = left_file | right_file
-            # Instant check: are there any white pawns on adjacent files?
-            if not (white_pawns & chess.SquareSet(adjacent_mask)):
-                analysis['white_isolated'].append(square)
-
-        for square in black_pawns:
-            file = chess.square_file(square)
-            left_file = FILE_MASKS[file-1] if file > 0 else 0
-            right_file = FILE_MASKS[file+1] if file < 7 else 0
-            adjacent_mask = left_file | right_file
-            if not (black_pawns & chess.SquareSet(adjacent_mask)):
-                analysis['black_isolated'].append(square)
+        # A pawn is isolated if no friendly pawn stands anywhere on an adjacent file.
+        # Pawns plus both spans fill every file holding a pawn; shifted sideways, they cover the neighbours.
+        white_files = white_pawns | white_north | white_south
+        black_files = black_pawns | black_north | black_south
+        analysis['isolated'][chess.WHITE].extend(chess.scan_forward(
+            white_pawns & ~(chess.shift_left(white_files) | chess.shift_right(white_files))))
+        analysis['isolated'][chess.BLACK].extend(chess.scan_forward(
+            black_pawns & ~(chess.shift_left(black_files) | chess.shift_right(black_files))))
 
         # --- PASSED PAWNS ---
-        for square in white_pawns:
-            rank = chess.square_rank(square)
-            file = chess.square_file(square)
-            # Check if no enemy pawns block path to promotion (ranks ahead)
-            is_passed = True
-            for check_file in [file - 1, file, file + 1]:
-                if 0 <= check_file <= 7:
-                    for check_rank in range(rank + 1, 8):
-                        check_square = chess.square(check_file, check_rank)
-                        if check_square in black_pawns:
-                            is_passed = False
-                            break
-                    if not is_passed:
-                        break
-            if is_passed:
-                analysis['white_passed'].append(square)
-
-        for square in black_pawns:
-            rank = chess.square_rank(square)
-            file = chess.square_file(square)
-            is_passed = True
-            for check_file in [file - 1, file, file + 1]:
-                if 0 <= check_file <= 7:
-                    for check_rank in range(0, rank):
-                        check_square = chess.square(check_file, check_rank)
-                        if check_square in white_pawns:
-                            is_passed = False
-                            break
-                    if not is_passed:
-                        break
-            if is_passed:
-                analysis['black_passed'].append(square)
+        # A pawn is passed if no enemy pawn stands in front of it on its own or an adjacent file.
+        # The squares an enemy pawn guards that way are its rear span (from our side) widened by one file.
+        white_blocked = black_south | chess.shift_left(black_south) | chess.shift_right(black_south)
+        black_blocked = white_north | chess.shift_left(white_north) | chess.shift_right(white_north)
+        analysis['passed'][chess.WHITE].extend(chess.scan_forward(white_pawns & ~white_blocked))
+        analysis['passed'][chess.BLACK].extend(chess.scan_forward(black_pawns & ~black_blocked))
 
         # --- BACKWARD PAWNS ---
         # A backward pawn is:
-        # 1. Behind all pawns of the same color on adjacent files
-        # 2. Cannot be safely advanced
-        for square in white_pawns:
-            rank = chess.square_rank(square)
-            file = chess.square_file(square)
-
-            # Check if pawn is behind all friendly pawns on adjacent files
-            is_behind_adjacent_pawns = False
-            has_adjacent_pawns = False
-            for adj_file in [file - 1, file + 1]:
-                if 0 <= adj_file <= 7:
-                    # Check all pawns on this adjacent file
-                    for pawn_square in white_pawns:
-                        if chess.square_file(pawn_square) == adj_file:
-                            has_adjacent_pawns = True
-                            pawn_rank = chess.square_rank(pawn_square)
-                            # If any adjacent pawn is ahead of us (higher rank), we're behind
-                            if pawn_rank > rank:
-                                is_behind_adjacent_pawns = True
-                                break
-                    if is_behind_adjacent_pawns:
-                        break
+        # 1. Behind a pawn of the same color on an adjacent file
+        # 2. Cannot safely advance (stop square attacked by an enemy pawn)
+        white_behind = chess.shift_left(white_south) | chess.shift_right(white_south)
+        black_behind = chess.shift_left(black_north) | chess.shift_right(black_north)
+        # Pawn attacks shifted back one rank land on the pawns whose stop square is hit
+        white_stop_attacked = chess.shift_2_down(chess.shift_left(black_pawns) | chess.shift_right(black_pawns))
+        black_stop_attacked = chess.shift_2_up(chess.shift_left(white_pawns) | chess.shift_right(white_pawns))
+        analysis['backward'][chess.WHITE].extend(chess.scan_forward(white_pawns & white_behind & white_stop_attacked))
+        analysis['backward'][chess.BLACK].extend(chess.scan_forward(black_pawns & black_behind & black_stop_attacked))
+
+        self._pawn_cache[pawn_key] = tuple(analysis[pattern] for pattern in _PAWN_PATTERNS)
+        if len(self._pawn_cache) > GameConstants.PAWN_CACHE_SIZE:
+            self._pawn_cache.popitem(last=False)
+
+    def _compute_forks(self, analysis: dict) -> None:
+        """Fill fork opportunities (2+ enemy non-pawn pieces hit from one square) for both colors"""
+        board = self.board
+        occupied = board.occupied
+        occupied_co = board.occupied_co
+        pawns = board.pawns
+
+        # Hot-loop lookups bound once: tables, helpers and board methods used per candidate square
+        bb_squares = chess.BB_SQUARES
+        square_at = chess.square
+        scan_forward = chess.scan_forward
+        popcount = chess.popcount
+        piece_type_at = board.piece_type_at
+        attackers_mask = board.attackers_mask
+        piece_attacks = _piece_attacks
+        ep_square = board.ep_square
+        pawn_type = chess.PAWN
 
-            # Only consider it backward if there are adjacent pawns and we're behind them
-            if has_adjacent_pawns and is_behind_adjacent_pawns:
-                # Check if pawn can safely advance
-                can_safely_advance = True
-                if rank < 7:  # Not on last rank
-                    advance_square = chess.square(file, rank + 1)
-                    # Check if advancing would put us under attack by enemy pawns
-                    for enemy_file in [file - 1, file + 1]:
-                        if 0 <= enemy_file <= 7 and rank + 2 <= 7:
-                            enemy_square = chess.square(enemy_file, rank + 2)
-                            if enemy_square in black_pawns:
-                                can_safely_advance = False
-                                break
-
-                if not can_safely_advance:
-                    analysis['white_backward'].append(square)
-
-        for square in black_pawns:
-            rank = chess.square_rank(square)
-            file = chess.square_file(square)
-
-            # Check if pawn is behind all friendly pawns on adjacent files
-            is_behind_adjacent_pawns = False
-            has_adjacent_pawns = False
-            for adj_file in [file - 1, file + 1]:
-                if 0 <= adj_file <= 7:
-                    # Check all pawns on this adjacent file
-                    for pawn_square in black_pawns:
-                        if chess.square_file(pawn_square) == adj_file:
-                            has_adjacent_pawns = True
-                            pawn_rank = chess.square_rank(pawn_square)
-                            # If any adjacent pawn is ahead of us (lower rank), we're behind
-                            if pawn_rank < rank:
-                                is_behind_adjacent_pawns = True
-                                break
-                    if is_behind_adjacent_pawns:
-                        break
-
-            # Only consider it backward if there are adjacent pawns and we're behind them
-            if has_adjacent_pawns and is_behind_adjacent_pawns:
-                # Check if pawn can safely advance
-                can_safely_advance = True
-                if rank > 0:  # Not on first rank
-                    advance_square = chess.square(file, rank - 1)
-                    # Check if advancing would put us under attack by enemy pawns
-                    for enemy_file in [file - 1, file + 1]:
-                        if 0 <= enemy_file <= 7 and rank - 2 >= 0:
-                            enemy_square = chess.square(enemy_file, rank - 2)
-                            if enemy_square in white_pawns:
-                                can_safely_advance = False
-                                break
-
-                if not can_safely_advance:
-                    analysis['black_backward'].append(square)
-
-        # --- FORK DETECTION ---
         # Detect all possible forks for both colors
         for color in [chess.WHITE, chess.BLACK]:
-            color_pieces = white_pieces if color == chess.WHITE else black_pieces
             enemy_color = not color
+            forks = analysis['forks'][color]
+            own_bb = occupied_co[color]
+            enemy_non_pawns = occupied_co[enemy_color] & ~pawns
 
             # For each piece of this color
-            for origin_square in color_pieces:
-                piece = self.board.piece_at(origin_square)
-
+            for origin_square in scan_forward(own_bb):
                 # Get all pseudo-legal moves for this piece (don't check if it's this color's turn)
                 # We use attacks_mask to get all squares this piece can move to
-                piece_type = piece.piece_type
+                piece_type = piece_type_at(origin_square)
 
                 # Generate candidate destination squares based on piece type
-                if piece_type == chess.PAWN:
+                if piece_type == pawn_type:
                     # Pawn moves: one square forward, two squares forward (if on starting rank), diagonal captures
                     rank = chess.square_rank(origin_square)
                     file = chess.square_file(origin_square)
@@ -454,120 +504,89 @@ class BoardState:
                     # Forward moves
                     if color == chess.WHITE:
                         if rank < 7:
-                            forward_one = chess.square(file, rank + 1)
-                            if not self.board.piece_at(forward_one):
+                            forward_one = square_at(file, rank + 1)
+                            if not occupied & bb_squares[forward_one]:
                                 candidate_squares.append(forward_one)
                                 if rank == 1:  # Starting rank
-                                    forward_two = chess.square(file, rank + 2)
-                                    if not self.board.piece_at(forward_two):
+                                    forward_two = square_at(file, rank + 2)
+                                    if not occupied & bb_squares[forward_two]:
                                         candidate_squares.append(forward_two)
                         # Diagonal captures (only if there's a piece to capture or en passant)
                         if rank < 7 and file > 0:
-                            diag_square = chess.square(file - 1, rank + 1)
-                            if self.board.piece_at(diag_square) or self.board.ep_square == diag_square:
+                            diag_square = square_at(file - 1, rank + 1)
+                            if occupied & bb_squares[diag_square] or ep_square == diag_square:
                                 candidate_squares.append(diag_square)
                         if rank < 7 and file < 7:
-                            diag_square = chess.square(file + 1, rank + 1)
-                            if self.board.piece_at(diag_square) or self.board.ep_square == diag_square:
+                            diag_square = square_at(file + 1, rank + 1)
+                            if occupied & bb_squares[diag_square] or ep_square == diag_square:
                                 candidate_squares.append(diag_square)
                     else:  # BLACK
                         if rank > 0:
-                            forward_one = chess.square(file, rank - 1)
-                            if not self.board.piece_at(forward_one):
+                            forward_one = square_at(file, rank - 1)
+                            if not occupied & bb_squares[forward_one]:
                                 candidate_squares.append(forward_one)
                                 if rank == 6:  # Starting rank
-                                    forward_two = chess.square(file, rank - 2)
-                                    if not self.board.piece_at(forward_two):
+                                    forward_two = square_at(file, rank - 2)
+                                    if not occupied & bb_squares[forward_two]:
                                         candidate_squares.append(forward_two)
                         # Diagonal captures (only if there's a piece to capture or en passant)
                         if rank > 0 and file > 0:
-                            diag_square = chess.square(file - 1, rank - 1)
-                            if self.board.piece_at(diag_square) or self.board.ep_square == diag_square:
+                            diag_square = square_at(file - 1, rank - 1)
+                            if occupied & bb_squares[diag_square] or ep_square == diag_square:
                                 candidate_squares.append(diag_square)
                         if rank > 0 and file < 7:
-                            diag_square = chess.square(file + 1, rank - 1)
-                            if self.board.piece_at(diag_square) or self.board.ep_square == diag_square:
+                            diag_square = square_at(file + 1, rank - 1)
+                            if occupied & bb_squares[diag_square] or ep_square == diag_square:
                                 candidate_squares.append(diag_square)
                 else:
                     # For non-pawns, use the attacks method to get all possible destination squares
-                    candidate_squares = list(self.board.attacks(origin_square))
+                    candidate_squares = list(scan_forward(board.attacks_mask(origin_square)))
+
+                # BITBOARD: Evaluate each hypothetical move on raw ints - the board is never mutated
+                vacated_occupied = occupied & ~bb_squares[origin_square]
 
                 # For each candidate destination square
                 for destination_square in candidate_squares:
                     # Skip if destination has our own piece
-                    destination_piece = self.board.piece_at(destination_square)
-                    if destination_piece and destination_piece.color == color:
+                    if own_bb & bb_squares[destination_square]:
                         continue
 
-                    # Temporarily make the move
-                    captured_piece = self.board.piece_at(destination_square)
-                    self.board.set_piece_at(destination_square, piece)
-                    self.board.remove_piece_at(origin_square)
+                    occupied_after = vacated_occupied | bb_squares[destination_square]
 
                     # Skip if destination square is defended by enemy (check AFTER moving)
                     # EXCEPTION: Allow pawn forks even on defended squares (trading piece for pawn is losing)
-                    if self.board.is_attacked_by(enemy_color, destination_square):
-                        if piece.piece_type != chess.PAWN:  # Only filter non-pawn forks
-                            # Undo the temporary move
-                            self.board.set_piece_at(origin_square, piece)
-                            if captured_piece:
-                                self.board.set_piece_at(destination_square, captured_piece)
-                            else:
-                                self.board.remove_piece_at(destination_square)
+                    if piece_type != pawn_type:  # Only filter non-pawn forks
+                        if attackers_mask(enemy_color, destination_square, occupied_after):
                             continue
-                        # For pawns, continue to check if it's a fork
 
                     # Get all squares this piece attacks from the new position
-                    attacked_squares = self.board.attacks(destination_square)
+                    attacked_bb = piece_attacks(piece_type, color, destination_square, occupied_after)
 
                     # Find enemy pieces (non-pawns) being attacked
-                    forked_pieces = []
-                    for attacked_sq in attacked_squares:
-                        attacked_piece = self.board.piece_at(attacked_sq)
-                        if (attacked_piece and
-                            attacked_piece.color == enemy_color and
-                            attacked_piece.piece_type != chess.PAWN):
-                            forked_pieces.append(attacked_sq)
-
-                    # Undo the temporary move
-                    self.board.set_piece_at(origin_square, piece)
-                    if captured_piece:
-                        self.board.set_piece_at(destination_square, captured_piece)
-                    else:
-                        self.board.remove_piece_at(destination_square)
+                    forked_bb = attacked_bb & enemy_non_pawns
 
                     # If 2+ non-pawn pieces are attacked, it's a fork!
-                    if len(forked_pieces) >= 2:
+                    if popcount(forked_bb) >= 2:
                         fork_data = {
                             'origin': origin_square,
                             'destination': destination_square,
-                            'forked_pieces': forked_pieces
+                            'forked_pieces': list(scan_forward(forked_bb))
                         }
-                        if color == chess.WHITE:
-                            analysis['white_forks'].append(fork_data)
-                        else:
-                            analysis['black_forks'].append(fork_data)
-
-        return analysis
+                        forks.append(fork_data)
 
     def reset_to_initial_position(self) -> None:
         """Reset the entire game state to the initial starting position"""
-        self.board = chess.Board()
+        # Reset in place - keeps the existing Board allocation
+        self.board.reset()
         self._update_game_status()
-        self.move_history = []
-        self.last_move = None
-        self.undo_stack = []
-        self.redo_stack = []
+        self.redo_stack.clear()
         self._invalidate_analysis()  # Invalidate cache after position change
 
 
     def is_king_in_check(self, color: bool) -> bool:
         """Check if the king of a specific color is in check"""
-        original_turn = self.board.turn
-        self.board.turn = color
-        in_check = self.board.is_check()
-        self.board.turn = original_turn
-        return in_check
+        king_square = self.board.king(color)
+        return king_square is not None and self.board.is_attacked_by(not color, king_square)
 
     def can_castle(self, color: bool, kingside: bool) -> bool:
         """Check if castling is possible"""
@@ -592,55 +611,34 @@ class BoardState:
 
         return False
 
-    def get_hanging_pieces(self, color: bool) -> List[chess.Square]:
-        """Get list of hanging pieces (attacked but not defended) for the given color"""
-        self._ensure_analysis()
-        return self._analysis['white_hanging' if color == chess.WHITE else 'black_hanging']
+    def get_hanging_pieces(self, color: bool) -> chess.SquareSet:
+        """Get the set of hanging pieces (attacked but not defended) for the given color"""
+        self._ensure_analysis(ANALYSIS_HANGING)
+        return chess.SquareSet(self._analysis['hanging'][color])
 
-    def _get_attackers(self, target_square: chess.Square, attacker_color: bool) -> List[chess.Square]:
-        """Get all pieces of the given color that attack the target square (including x-ray attacks)"""
-        attackers = []
+    def _attackers_bb(self, target_square: chess.Square, attacker_color: bool,
+                      occupied: Optional[chess.Bitboard] = None) -> chess.Bitboard:
+        """Bitboard of pieces of the given color attacking the target square, x-rays included"""
+        if occupied is None:
+            occupied = self.board.occupied
 
-        # First, get direct attackers
-        direct_attackers = list(self.board.attackers(attacker_color, target_square))
-        attackers.extend(direct_attackers)
+        # Direct attackers against the given occupancy
+        direct_bb = self.board.attackers_mask(attacker_color, target_square, occupied)
 
-        # Now find x-ray attackers: pieces that would attack if direct attackers were removed
-        # Only sliding pieces (bishops, rooks, queens) can create x-ray attacks
-        target_piece = self.board.piece_at(target_square)
-
-        # Temporarily remove target piece and all direct attackers to reveal x-ray attackers
-        removed_pieces = []
-        if target_piece:
-            self.board.remove_piece_at(target_square)
-            removed_pieces.append((target_square, target_piece))
-
-        for sq in direct_attackers:
-            piece = self.board.piece_at(sq)
-            if piece:
-                self.board.remove_piece_at(sq)
-                removed_pieces.append((sq, piece))
-
-        # Find new attackers that were previously blocked
-        xray_attackers = list(self.board.attackers(attacker_color, target_square))
-        attackers.extend(xray_attackers)
-
-        # Restore all removed pieces
-        for sq, piece in removed_pieces:
-            self.board.set_piece_at(sq, piece)
-
-        return attackers
+        # X-ray attackers: lift the target and direct attackers off the occupancy and look again
+        xray_occupied = occupied & ~direct_bb & ~chess.BB_SQUARES[target_square]
+        return direct_bb | self.board.attackers_mask(attacker_color, target_square, xray_occupied)
 
     def get_tactically_interesting_squares(self) -> List[chess.Square]:
         """Get all squares that have tactical potential for exchange evaluation"""
         interesting_squares = []
 
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece is not None:
-                enemy_color = not piece.color
-                if self.board.is_attacked_by(enemy_color, square):
-                    interesting_squares.append(square)
+        # BITBOARD: Visit only occupied squares and test the raw attackers mask
+        white_bb = self.board.occupied_co[chess.WHITE]
+        for square in chess.scan_forward(self.board.occupied):
+            enemy_color = not (white_bb & chess.BB_SQUARES[square])
+            if self.board.attackers_mask(enemy_color, square):
+                interesting_squares.append(square)
 
         return interesting_squares
 
@@ -650,39 +648,38 @@ class BoardState:
 
         if target_piece is None:
             # Empty square - anyone can attack it, but no one defends it
-            white_attackers = self._get_attackers(target_square, chess.WHITE)
-            black_attackers = self._get_attackers(target_square, chess.BLACK)
-            return (white_attackers + black_attackers, [])
+            # BITBOARD: Both colors' attacker masks unpacked straight into one list
+            attackers = list(chess.scan_forward(self._attackers_bb(target_square, chess.WHITE)))
+            attackers.extend(chess.scan_forward(self._attackers_bb(target_square, chess.BLACK)))
+            return (attackers, [])
 
         # Square contains a piece
         target_color = target_piece.color
         enemy_color = not target_color
 
         # Attackers are enemy pieces
-        attackers = self._get_attackers(target_square, enemy_color)
+        attackers = list(chess.scan_forward(self._attackers_bb(target_square, enemy_color)))
 
         # Defenders: friendly pieces that could recapture if this piece is taken
+        # (the target piece itself is already masked out)
         defenders = self._get_attackers_if_empty(target_square, target_color)
 
-        # Remove the target piece itself from defenders
-        defenders = [sq for sq in defenders if sq != target_square]
-
         return (attackers, defenders)
 
     def _get_attackers_if_empty(self, target_square: chess.Square, attacker_color: bool) -> List[chess.Square]:
         """Get all pieces that could attack this square if it were empty"""
-        # Temporarily remove the piece
-        original_piece = self.board.piece_at(target_square)
-        self.board.remove_piece_at(target_square)
-
-        # Get attackers
-        attackers = self._get_attackers(target_square, attacker_color)
-
-        # Restore piece
-        if original_piece:
-            self.board.set_piece_at(target_square, original_piece)
-
-        return attackers
+        # Memoized per position alongside the rest of the analysis
+        self._ensure_analysis(0)
+        memo = self._analysis['defenders']
+        key = (target_square, attacker_color)
+        if key not in memo:
+            # BITBOARD: Treat the square as empty via the occupancy mask - the board is untouched
+            target_bb = chess.BB_SQUARES[target_square]
+            occupied = self.board.occupied & ~target_bb
+            # AND-NOT the target out of the result so the piece never defends itself
+            attackers_bb = self._attackers_bb(target_square, attacker_color, occupied) & ~target_bb
+            memo[key] = list(chess.scan_forward(attackers_bb))
+        return memo[key]
 
     def get_fen_position(self) -> str:
         """Generate FEN (Forsyth-Edwards Notation) string for the current position"""
@@ -690,53 +687,59 @@ class BoardState:
 
     def calculate_activity(self, color: bool) -> int:
         """Calculate total squares reachable by all pieces of a color (excluding pawns)"""
-        reachable_squares = set()
-
-        # Save current turn
-        original_turn = self.board.turn
-
-        # Set turn to the color we're checking
-        self.board.turn = color
+        return chess.popcount(self.get_reachable_squares(color))
+
+    def get_reachable_squares(self, color: bool) -> chess.Bitboard:
+        """Bitboard of squares the non-pawn pieces of a color can legally move to"""
+        self._ensure_analysis(0)
+        reachable = self._analysis['reachable']
+        if reachable[color] is None:
+            reachable[color] = self._compute_reachable_squares(color)
+        return reachable[color]
+
+    def _compute_reachable_squares(self, color: bool) -> chess.Bitboard:
+        """Union of legal destination squares for a color's non-pawn pieces"""
+        # Legal moves are generated for the side to move, so the other color
+        # is evaluated on a stackless copy with the turn flipped
+        if color == self.board.turn:
+            board = self.board
+        else:
+            board = self.board.copy(stack=False)
+            board.turn = color
 
         # Only count squares that pieces can legally reach
-        for move in self.board.legal_moves:
-            piece = self.board.piece_at(move.from_square)
-            if piece and piece.color == color and piece.piece_type != chess.PAWN:
-                reachable_squares.add(move.to_square)
+        # BITBOARD: Restrict generation to non-pawn pieces and OR the destinations together
+        reachable_bb = 0
+        for move in board.generate_legal_moves(from_mask=board.occupied_co[color] & ~board.pawns):
+            reachable_bb |= chess.BB_SQUARES[move.to_square]
 
-        # Restore original turn
-        self.board.turn = original_turn
-
-        return len(reachable_squares)
+        return reachable_bb
 
     def get_activity_scores(self) -> Tuple[int, int]:
         """Get activity scores for both colors. Returns (white_activity, black_activity)"""
-        white_activity = self.calculate_activity(chess.WHITE)
-        black_activity = self.calculate_activity(chess.BLACK)
-        return (white_activity, black_activity)
+        # Stored with the position's analysis, so undo/redo back to a known position is free
+        self._ensure_analysis(0)
+        if self._analysis['activity'] is None:
+            white_activity = self.calculate_activity(chess.WHITE)
+            black_activity = self.calculate_activity(chess.BLACK)
+            self._analysis['activity'] = (white_activity, black_activity)
+        return self._analysis['activity']
 
     def count_developed_pieces(self, color: bool) -> int:
         """Count how many pieces are developed (moved off back rank or connected rooks)"""
-        if color == chess.WHITE:
-            starting_rank = 0  # rank 1
-            king_start = chess.E1
-            queenside_rook_start = chess.A1
-            kingside_rook_start = chess.H1
-        else:
-            starting_rank = 7  # rank 8
-            king_start = chess.E8
-            queenside_rook_start = chess.A8
-            kingside_rook_start = chess.H8
+        board = self.board
+        return self._count_developed(color, board.knights | board.bishops | board.queens)
 
-        developed_count = 0
+    def _count_developed(self, color: bool, minor_and_queens: chess.Bitboard) -> int:
+        """Developed-piece count given the combined knights/bishops/queens bitboard"""
+        king_start = chess.E1 if color == chess.WHITE else chess.E8
+
+        # BITBOARD: Split this color's pieces into back-rank and off-back-rank sets
+        back_rank = chess.BB_RANK_1 if color == chess.WHITE else chess.BB_RANK_8
+        own_bb = self.board.occupied_co[color]
 
         # Check knights, bishops, and queen - simple: off back rank = developed
-        for piece_type in [chess.KNIGHT, chess.BISHOP, chess.QUEEN]:
-            for square in chess.SQUARES:
-                piece = self.board.piece_at(square)
-                if piece and piece.color == color and piece.piece_type == piece_type:
-                    if chess.square_rank(square) != starting_rank:
-                        developed_count += 1
+        developed_count = chess.popcount(minor_and_queens & own_bb & ~back_rank)
 
         # King: developed if castled (not on starting square)
         king_square = self.board.king(color)
@@ -744,46 +747,24 @@ class BoardState:
             developed_count += 1
 
         # Rooks: developed if moved OR if rooks are connected
-        rook_squares = []
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.ROOK:
-                rook_squares.append(square)
-
-        # Check if rooks are connected (can see each other on back rank)
-        rooks_connected = False
-        if len(rook_squares) == 2:
-            r1, r2 = rook_squares
-            # Both on starting rank?
-            if chess.square_rank(r1) == starting_rank and chess.square_rank(r2) == starting_rank:
-                # Check if they can see each other (no pieces between them)
-                file1, file2 = chess.square_file(r1), chess.square_file(r2)
-                min_file, max_file = min(file1, file2), max(file1, file2)
-                pieces_between = False
-                for file in range(min_file + 1, max_file):
-                    check_square = chess.square(file, starting_rank)
-                    if self.board.piece_at(check_square):
-                        pieces_between = True
-                        break
-                if not pieces_between:
-                    rooks_connected = True
-
-        # Count developed rooks
-        for rook_square in rook_squares:
-            if chess.square_rank(rook_square) != starting_rank:
-                # Rook moved off back rank
-                developed_count += 1
-            elif rooks_connected:
-                # Rook still on back rank but connected
-                developed_count += 1
+        rooks = self.board.rooks & own_bb
+        developed_count += chess.popcount(rooks & ~back_rank)
+
+        # Check if rooks are connected (exactly two rooks, both on the back rank, nothing between)
+        if chess.popcount(rooks) == 2 and rooks & back_rank == rooks:
+            if not chess.between(chess.lsb(rooks), chess.msb(rooks)) & self.board.occupied:
+                # Both rooks still on back rank but connected
+                developed_count += 2
 
         return developed_count
 
     def get_development_scores(self) -> Tuple[int, int]:
         """Get development scores for both colors. Returns (white_dev, black_dev)"""
-        white_dev = self.count_developed_pieces(chess.WHITE)
-        black_dev = self.count_developed_pieces(chess.BLACK)
-        return (white_dev, black_dev)
+        # Piece sets are loaded once and masked per color
+        board = self.board
+        minor_and_queens = board.knights | board.bishops | board.queens
+        return (self._count_developed(chess.WHITE, minor_and_queens),
+                self._count_developed(chess.BLACK, minor_and_queens))
 
     def count_incursions(self, color: bool) -> int:
         """
@@ -792,179 +773,167 @@ class BoardState:
         For black: counts black pieces on ranks 1-4 (squares 0-31)
         Higher is better (more offensive presence).
         """
-        count = 0
-
-        if color == chess.WHITE:
-            # White's incursions: white pieces on ranks 5-8 (squares 32-63)
-            for square in range(32, 64):
-                piece = self.board.piece_at(square)
-                if piece and piece.color == color:
-                    count += 1
-        else:
-            # Black's incursions: black pieces on ranks 1-4 (squares 0-31)
-            for square in range(32):
-                piece = self.board.piece_at(square)
-                if piece and piece.color == color:
-                    count += 1
+        # BITBOARD: popcount of this color's pieces in the opponent's half
+        enemy_half = _BB_BLACK_HALF if color == chess.WHITE else _BB_WHITE_HALF
+        return chess.popcount(self.board.occupied_co[color] & enemy_half)
 
-        return count
+    def get_incursion_pieces(self, color: bool) -> chess.SquareSet:
+        """Get the set of pieces of the given color standing in the opponent's half"""
+        enemy_half = _BB_BLACK_HALF if color == chess.WHITE else _BB_WHITE_HALF
+        return chess.SquareSet(self.board.occupied_co[color] & enemy_half)
 
     def get_incursion_scores(self) -> Tuple[int, int]:
         """Get incursion counts for both colors. Returns (white_incursions, black_incursions)"""
-        white_incursions = self.count_incursions(chess.WHITE)
-        black_incursions = self.count_incursions(chess.BLACK)
-        return (white_incursions, black_incursions)
+        occupied_co = self.board.occupied_co
+        return (chess.popcount(occupied_co[chess.WHITE] & _BB_BLACK_HALF),
+                chess.popcount(occupied_co[chess.BLACK] & _BB_WHITE_HALF))
+
+    def get_attacked_pieces(self, color: bool) -> chess.SquareSet:
+        """Get the set of pieces of the given color that are attacked by the enemy"""
+        self._ensure_analysis(ANALYSIS_HANGING)
+        return chess.SquareSet(self._analysis['attacked'][color])
 
     def count_attacked_pieces(self, color: bool) -> int:
         """Count how many pieces of this color are attacked by the enemy"""
-        self._ensure_analysis()
-        attacked_list = self._analysis['white_attacked' if color == chess.WHITE else 'black_attacked']
-        return len(attacked_list)
+        self._ensure_analysis(ANALYSIS_HANGING)
+        return chess.popcount(self._analysis['attacked'][color])
 
     def get_attacked_scores(self) -> Tuple[int, int]:
         """Get attacked piece counts for both colors. Returns (white_attacked, black_attacked)"""
-        white_attacked = self.count_attacked_pieces(chess.WHITE)
-        black_attacked = self.count_attacked_pieces(chess.BLACK)
-        return (white_attacked, black_attacked)
+        self._ensure_analysis(ANALYSIS_HANGING)
+        attacked = self._analysis['attacked']
+        return (chess.popcount(attacked[chess.WHITE]), chess.popcount(attacked[chess.BLACK]))
 
     def count_hanging_pieces(self, color: bool) -> int:
         """Count how many pieces of this color are hanging (attacked but not defended)"""
-        return len(self.get_hanging_pieces(color))
+        self._ensure_analysis(ANALYSIS_HANGING)
+        return chess.popcount(self._analysis['hanging'][color])
 
     def get_hanging_scores(self) -> Tuple[int, int]:
         """Get hanging piece counts for both colors. Returns (white_hanging, black_hanging)"""
-        white_hanging = self.count_hanging_pieces(chess.WHITE)
-        black_hanging = self.count_hanging_pieces(chess.BLACK)
-        return (white_hanging, black_hanging)
+        self._ensure_analysis(ANALYSIS_HANGING)
+        hanging = self._analysis['hanging']
+        return (chess.popcount(hanging[chess.WHITE]), chess.popcount(hanging[chess.BLACK]))
 
-    def get_pinned_pieces(self, color: bool) -> List[int]:
-        """Get list of pinned pieces for the given color"""
-        self._ensure_analysis()
-        return self._analysis['white_pinned' if color == chess.WHITE else 'black_pinned']
+    def get_pinned_pieces(self, color: bool) -> chess.SquareSet:
+        """Get the set of pinned pieces for the given color"""
+        self._ensure_analysis(ANALYSIS_PINS)
+        return chess.SquareSet(self._analysis['pinned'][color])
 
-    def get_skewered_pieces(self, color: bool) -> List[int]:
-        """Get list of skewered pieces for the given color"""
-        self._ensure_analysis()
-        return self._analysis['white_skewered' if color == chess.WHITE else 'black_skewered']
+    def get_skewered_pieces(self, color: bool) -> chess.SquareSet:
+        """Get the set of skewered pieces for the given color"""
+        self._ensure_analysis(ANALYSIS_SKEWERS)
+        return chess.SquareSet(self._analysis['skewered'][color])
 
     def get_fork_opportunities(self, color: bool) -> List[dict]:
         """Get list of fork opportunities for the given color
         Returns list of dicts: {origin: square, destination: square, forked_pieces: [squares]}
         """
-        self._ensure_analysis()
-        return self._analysis['white_forks' if color == chess.WHITE else 'black_forks']
+        self._ensure_analysis(ANALYSIS_FORKS)
+        return self._analysis['forks'][color]
 
     def count_pawns(self, color: bool) -> int:
         """Count the number of pawns for a given color"""
-        count = 0
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.PAWN:
-                count += 1
-        return count
+        # BITBOARD: popcount of this color's pawns
+        return chess.popcount(self.board.pawns & self.board.occupied_co[color])
 
     def get_pawn_counts(self) -> Tuple[int, int]:
         """Get pawn counts for both colors. Returns (white_pawns, black_pawns)"""
-        white_pawns = self.count_pawns(chess.WHITE)
-        black_pawns = self.count_pawns(chess.BLACK)
-        return (white_pawns, black_pawns)
+        # BITBOARD: Load the pawn set once and popcount it against each color
+        pawns = self.board.pawns
+        occupied_co = self.board.occupied_co
+        return (chess.popcount(pawns & occupied_co[chess.WHITE]),
+                chess.popcount(pawns & occupied_co[chess.BLACK]))
+
+    def get_backward_pawns(self, color: bool) -> List[chess.Square]:
+        """Get list of backward pawns for the given color"""
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        return self._analysis['backward'][color]
+
+    def get_isolated_pawns(self, color: bool) -> List[chess.Square]:
+        """Get list of isolated pawns for the given color"""
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        return self._analysis['isolated'][color]
+
+    def get_doubled_pawns(self, color: bool) -> List[chess.Square]:
+        """Get list of doubled pawns (every pawn on a file holding more than one) for the given color"""
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        return self._analysis['doubled'][color]
+
+    def get_passed_pawns(self, color: bool) -> List[chess.Square]:
+        """Get list of passed pawns for the given color"""
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        return self._analysis['passed'][color]
 
     def count_backward_pawns(self, color: bool) -> int:
         """Count backward pawns - pawns that cannot be defended by other pawns and cannot safely advance"""
-        self._ensure_analysis()
-        backward_list = self._analysis['white_backward' if color == chess.WHITE else 'black_backward']
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        backward_list = self._analysis['backward'][color]
         return len(backward_list)
 
     def count_isolated_pawns(self, color: bool) -> int:
         """Count pawns with no friendly pawns on adjacent files"""
-        self._ensure_analysis()
-        isolated_list = self._analysis['white_isolated' if color == chess.WHITE else 'black_isolated']
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        isolated_list = self._analysis['isolated'][color]
         return len(isolated_list)
 
     def count_doubled_pawns(self, color: bool) -> int:
         """Count pawns that are doubled (more than one pawn on the same file)"""
-        self._ensure_analysis()
-        doubled_list = self._analysis['white_doubled' if color == chess.WHITE else 'black_doubled']
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        doubled_list = self._analysis['doubled'][color]
         return len(doubled_list)
 
     def count_passed_pawns(self, color: bool) -> int:
         """Count passed pawns - pawns with no opponent pawns blocking their path to promotion"""
-        self._ensure_analysis()
-        passed_list = self._analysis['white_passed' if color == chess.WHITE else 'black_passed']
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        passed_list = self._analysis['passed'][color]
         return len(passed_list)
 
     def get_pawn_statistics(self) -> Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]:
         """Get pawn statistics for both colors"""
+        # One cache lookup serves all eight counts
+        self._ensure_analysis(ANALYSIS_PAWNS)
+        analysis = self._analysis
         white_stats = (
-            self.count_backward_pawns(chess.WHITE),
-            self.count_isolated_pawns(chess.WHITE),
-            self.count_doubled_pawns(chess.WHITE),
-            self.count_passed_pawns(chess.WHITE)
+            len(analysis['backward'][chess.WHITE]),
+            len(analysis['isolated'][chess.WHITE]),
+            len(analysis['doubled'][chess.WHITE]),
+            len(analysis['passed'][chess.WHITE])
         )
         black_stats = (
-            self.count_backward_pawns(chess.BLACK),
-            self.count_isolated_pawns(chess.BLACK),
-            self.count_doubled_pawns(chess.BLACK),
-            self.count_passed_pawns(chess.BLACK)
+            len(analysis['backward'][chess.BLACK]),
+            len(analysis['isolated'][chess.BLACK]),
+            len(analysis['doubled'][chess.BLACK]),
+            len(analysis['passed'][chess.BLACK])
         )
         return (white_stats, black_stats)
 
     def get_captured_pieces(self) -> Tuple[List[int], List[int]]:
         """Calculate captured pieces by comparing current board to starting position.
         Returns (captured_white, captured_black) as lists of piece types sorted by value descending."""
-        # Starting piece counts (excluding kings)
-        starting_counts = {
-            chess.PAWN: 8,
-            chess.KNIGHT: 2,
-            chess.BISHOP: 2,
-            chess.ROOK: 2,
-            chess.QUEEN: 1
-        }
-
-        # Count current pieces on board
-        white_counts = {piece_type: 0 for piece_type in starting_counts.keys()}
-        black_counts = {piece_type: 0 for piece_type in starting_counts.keys()}
-
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece and piece.piece_type != chess.KING:
-                if piece.color == chess.WHITE:
-                    white_counts[piece.piece_type] += 1
-                else:
-                    black_counts[piece.piece_type] += 1
-
         # Calculate captured pieces
         captured_white = []
         captured_black = []
 
-        for piece_type in starting_counts.keys():
-            # White pieces captured (missing from board)
-            white_missing = starting_counts[piece_type] - white_counts[piece_type]
-            for _ in range(white_missing):
-                captured_white.append(piece_type)
-
-            # Black pieces captured (missing from board)
-            black_missing = starting_counts[piece_type] - black_counts[piece_type]
-            for _ in range(black_missing):
-                captured_black.append(piece_type)
-
-        # Sort by value descending
-        captured_white.sort(reverse=True)
-        captured_black.sort(reverse=True)
+        # Walking the types in descending order builds the lists already sorted
+        for piece_type, starting_count in _STARTING_COUNTS:
+            # BITBOARD: popcount each piece-type bitboard instead of scanning squares
+            # Pieces missing from board were captured (promotions can make this negative -> none)
+            white_count = chess.popcount(self.board.pieces_mask(piece_type, chess.WHITE))
+            black_count = chess.popcount(self.board.pieces_mask(piece_type, chess.BLACK))
+            captured_white += [piece_type] * (starting_count - white_count)
+            captured_black += [piece_type] * (starting_count - black_count)
 
         return (captured_white, captured_black)
 
     def copy(self) -> 'BoardState':
         """Create a deep copy of the board state"""
-        new_state = BoardState()
-        new_state.board = self.board.copy()
-        new_state.is_check = self.is_check
-        new_state.is_in_checkmate = self.is_in_checkmate
-        new_state.is_in_stalemate = self.is_in_stalemate
-        new_state.move_history = copy.copy(self.move_history)
-        new_state.last_move = self.last_move
-        # Don't copy undo/redo stacks
-        return new_state
+        # Adopt the copied board directly rather than building and discarding a fresh one
+        # Move history travels with the board's move stack; don't copy the redo stack
+        copied = BoardState(self.board.copy())
+        # Pawn results are keyed purely by pawn placement, so the copy can share them
+        copied._pawn_cache = self._pawn_cache
+        return copied
 
     def get_possible_moves(self, square: chess.Square) -> List[chess.Square]:
         """Get all legal moves for a piece at the given square"""
@@ -972,19 +941,25 @@ class BoardState:
         if not piece or piece.color != self.board.turn:
             return []
 
-        legal_moves = []
-        for move in self.board.legal_moves:
-            if move.from_square == square:
-                legal_moves.append(move.to_square)
+        return [move.to_square for move in self._legal_moves_from(square)]
 
-        return legal_moves
+    def _legal_moves_from(self, square: chess.Square) -> List[chess.Move]:
+        """Legal moves starting on a square, from a per-position cache"""
+        key = self.position_key()
+        if key != self._legal_moves_key:
+            by_from: Dict[chess.Square, List[chess.Move]] = {}
+            for move in self.board.legal_moves:
+                by_from.setdefault(move.from_square, []).append(move)
+            self._legal_moves_by_from = by_from
+            self._legal_moves_key = key
+        return self._legal_moves_by_from.get(square, [])
 
     def make_move(self, from_square: chess.Square, to_square: chess.Square) -> bool:
         """Execute a move if it's legal. Returns True if successful."""
         # Find the matching legal move
         chess_move = None
-        for move in self.board.legal_moves:
-            if move.from_square == from_square and move.to_square == to_square:
+        for move in self._legal_moves_from(from_square):
+            if move.to_square == to_square:
                 # For pawn promotion, default to queen
                 if move.promotion:
                     if move.promotion == chess.QUEEN:
@@ -997,13 +972,11 @@ class BoardState:
         if chess_move is None:
             return False
 
-        # Save state for undo
-        self._save_state_for_undo()
+        # A new move discards the undone line
+        self.redo_stack.clear()
 
         # Execute the move
         self.board.push(chess_move)
-        self.last_move = chess_move
-        self.move_history.append(chess_move)
 
         # Update game status
         self._update_game_status()
@@ -1016,8 +989,8 @@ class BoardState:
         """Execute a move with pawn promotion. Returns True if successful."""
         # Find the matching legal move
         chess_move = None
-        for move in self.board.legal_moves:
-            if move.from_square == from_square and move.to_square == to_square:
+        for move in self._legal_moves_from(from_square):
+            if move.to_square == to_square:
                 if move.promotion:
                     if move.promotion == promotion_piece:
                         chess_move = move
@@ -1029,13 +1002,11 @@ class BoardState:
         if chess_move is None:
             return False
 
-        # Save state for undo
-        self._save_state_for_undo()
+        # A new move discards the undone line
+        self.redo_stack.clear()
 
         # Execute the move
         self.board.push(chess_move)
-        self.last_move = chess_move
-        self.move_history.append(chess_move)
 
         # Update game status
         self._update_game_status()
@@ -1045,33 +1016,23 @@ class BoardState:
 
     def is_pawn_promotion(self, from_square: chess.Square, to_square: chess.Square) -> bool:
         """Check if a move would result in pawn promotion"""
-        piece = self.board.piece_at(from_square)
-        if not piece or piece.piece_type != chess.PAWN:
-            return False
-
-        to_rank = chess.square_rank(to_square)
-        if piece.color == chess.WHITE and to_rank == 7:
-            return True
-        elif piece.color == chess.BLACK and to_rank == 0:
-            return False
-
+        # BITBOARD: A pawn reaching its own last rank - rank 8 for white, rank 1 for black
+        pawn_bb = chess.BB_SQUARES[from_square] & self.board.pawns
+        if pawn_bb & self.board.occupied_co[chess.WHITE]:
+            return bool(chess.BB_SQUARES[to_square] & chess.BB_RANK_8)
+        if pawn_bb & self.board.occupied_co[chess.BLACK]:
+            return bool(chess.BB_SQUARES[to_square] & chess.BB_RANK_1)
         return False
 
     def is_checkmate(self, color: bool) -> bool:
         """Check if the specified color is in checkmate"""
-        original_turn = self.board.turn
-        self.board.turn = color
-        is_mate = self.board.is_checkmate()
-        self.board.turn = original_turn
-        return is_mate
+        # Only the side to move can be checkmated
+        return color == self.board.turn and self.board.is_checkmate()
 
     def is_stalemate(self, color: bool) -> bool:
         """Check if the specified color is in stalemate"""
-        original_turn = self.board.turn
-        self.board.turn = color
-        is_stale = self.board.is_stalemate()
-        self.board.turn = original_turn
-        return is_stale
+        # Only the side to move can be stalemated
+        return color == self.board.turn and self.board.is_stalemate()
 
     def _update_game_status(self) -> None:
         """Update is_check, is_in_checkmate, is_in_stalemate"""
@@ -1081,32 +1042,19 @@ class BoardState:
 
     def can_undo(self) -> bool:
         """Check if undo is possible"""
-        return len(self.undo_stack) > 0
+        return len(self.board.move_stack) > 0
 
     def can_redo(self) -> bool:
         """Check if redo is possible"""
         return len(self.redo_stack) > 0
 
-    def _save_state_for_undo(self) -> None:
-        """Save current board state to undo stack"""
-        state_tuple = (self.board.copy(), copy.copy(self.move_history), self.last_move)
-        self.undo_stack.append(state_tuple)
-        self.redo_stack.clear()
-
     def undo_move(self) -> bool:
         """Undo the last move. Returns True if successful."""
         if not self.can_undo():
             return False
 
-        # Save current state to redo stack
-        current_state = (self.board.copy(), copy.copy(self.move_history), self.last_move)
-        self.redo_stack.append(current_state)
-
-        # Restore previous state
-        previous_board, previous_history, previous_last_move = self.undo_stack.pop()
-        self.board = previous_board.copy()
-        self.move_history = previous_history
-        self.last_move = previous_last_move
+        # Take back the move and keep it for redo
+        self.redo_stack.append(self.board.pop())
 
         self._update_game_status()
         self._invalidate_analysis()  # Invalidate cache after undo
@@ -1117,15 +1065,8 @@ class BoardState:
         if not self.can_redo():
             return False
 
-        # Save current state to undo stack
-        current_state = (self.board.copy(), copy.copy(self.move_history), self.last_move)
-        self.undo_stack.append(current_state)
-
-        # Restore next state
-        next_board, next_history, next_last_move = self.redo_stack.pop()
-        self.board = next_board.copy()
-        self.move_history = next_history
-        self.last_move = next_last_move
+        # Replay the most recently undone move
+        self.board.push(self.redo_stack.pop())
 
         self._update_game_status()
         self._invalidate_analysis()  # Invalidate cache after redo
@@ -1133,20 +1074,12 @@ class BoardState:
 
     def rewind_to_start(self) -> bool:
         """Rewind to the beginning of the game. Returns True if successful."""
-        if len(self.undo_stack) == 0:
+        if not self.can_undo():
             return False
 
-        # Move all states from undo to redo
-        while len(self.undo_stack) > 0:
-            # Save current state to redo stack
-            current_state = (self.board.copy(), copy.copy(self.move_history), self.last_move)
-            self.redo_stack.append(current_state)
-
-            # Restore previous state
-            previous_board, previous_history, previous_last_move = self.undo_stack.pop()
-            self.board = previous_board.copy()
-            self.move_history = previous_history
-            self.last_move = previous_last_move
+        # Move all played moves onto the redo stack
+        while self.board.move_stack:
+            self.redo_stack.append(self.board.pop())
 
         self._update_game_status()
         self._invalidate_analysis()
@@ -1154,20 +1087,12 @@ class BoardState:
 
     def fast_forward_to_end(self) -> bool:
         """Fast forward to the end of the game. Returns True if successful."""
-        if len(self.redo_stack) == 0:
+        if not self.can_redo():
             return False
 
-        # Move all states from redo to undo
-        while len(self.redo_stack) > 0:
-            # Save current state to undo stack
-            current_state = (self.board.copy(), copy.copy(self.move_history), self.last_move)
-            self.undo_stack.append(current_state)
-
-            # Restore next state
-            next_board, next_history, next_last_move = self.redo_stack.pop()
-            self.board = next_board.copy()
-            self.move_history = next_history
-            self.last_move = next_last_move
+        # Replay every undone move
+        while self.redo_stack:
+            self.board.push(self.redo_stack.pop())
 
         self._update_game_status()
         self._invalidate_analysis()
@@ -1176,48 +1101,22 @@ class BoardState:
     def load_pgn_file(self, filename: str) -> bool:
         """Load a game from a PGN file"""
         try:
+            # Parse the PGN using python-chess, streaming straight from the file
             with open(filename, 'r') as f:
-                pgn_text = f.read()
-
-            # Parse the PGN using python-chess
-            import io
-            pgn = chess.pgn.read_game(io.StringIO(pgn_text))
+                pgn = chess.pgn.read_game(f)
 
             if pgn is None:
                 return False
 
-            # Reset to starting position
-            self.board = chess.Board()
-            self.move_history = []
-            self.last_move = None
+            # Reset to starting position in place (also clears the move stack)
+            self.board.reset()
 
-            # Replay all moves from the PGN
+            # Replay all moves from the PGN - the move stack doubles as the undo journal
             for move in pgn.mainline_moves():
                 self.board.push(move)
-                self.move_history.append(move)
-                self.last_move = move
-
-            # Build undo stack for game navigation
-            # The undo stack should contain positions to RESTORE when undoing
-            # When at position N, undo_stack top should have position N-1
-            self.undo_stack = []
-            temp_board = chess.Board()
-            temp_history = []
-
-            # Save each position BEFORE making each move
-            for move in pgn.mainline_moves():
-                # Save the position BEFORE this move (this is what we restore when undoing)
-                last_move_in_history = temp_history[-1] if temp_history else None
-                self.undo_stack.append((temp_board.copy(), copy.copy(temp_history), last_move_in_history))
-
-                # Now make the move
-                temp_board = temp_board.copy()
-                temp_board.push(move)
-                temp_history = copy.copy(temp_history)
-                temp_history.append(move)
 
             # Clear redo stack (we're at the end)
-            self.redo_stack = []
+            self.redo_stack.clear()
 
             self._update_game_status()
             self._invalidate_analysis()  # Invalidate cache after loading PGN
@@ -1261,13 +1160,9 @@ class BoardState:
                 fen_string = f.read().strip()
 
             # Set the board position from FEN
+            # set_fen() also clears the move stack, so there is nothing left to undo
             self.board.set_fen(fen_string)
-            self.move_history = []
-            self.last_move = None
-
-            # Clear undo/redo stacks
-            self.undo_stack = []
-            self.redo_stack = []
+            self.redo_stack.clear()
 
             self._update_game_status()
             self._invalidate_analysis()
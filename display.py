@@ -11,11 +11,27 @@ import json
 import os
 import sys
 import math
-import time
+from time import monotonic
 import chess
 from chess_board import BoardState, square_from_coords, coords_from_square
 from config import GameConfig, Colors, AnimationConfig, GameConstants
 
+# (row, col) display coordinates of every square, indexed by chess.Square
+_COORDS_FROM_SQUARE = tuple(coords_from_square(square) for square in chess.SQUARES)
+
+# Piece images: (image key, file relative to the resource root, size as a fraction of a square).
+# Keys are "w1" for white pawn, "b6" for black king, etc.; files follow {color}{piece}.png
+_PIECE_IMAGE_MANIFEST = tuple(
+    (f"{color_prefix}{piece_type}",
+     f"images/2x/{color_prefix}{chess.piece_symbol(piece_type).upper()}.png",
+     GameConstants.PAWN_SIZE_FACTOR if piece_type == chess.PAWN else GameConstants.PIECE_SIZE_FACTOR)
+    for color_prefix in ("w", "b")
+    for piece_type in chess.PIECE_TYPES
+)
+
+# Checkmate king animation: the 180 degree turn is pre-rotated in this many steps (6 degrees each)
+_KING_ROTATION_STEPS = 30
+
 # Get the correct path for bundled resources (PyInstaller compatibility)
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -30,7 +46,44 @@ def get_resource_path(relative_path):
 
 class ChessDisplay:
     """Handles the visual display of the chess game"""
-    
+
+    # Fixed attribute layout (no per-instance __dict__) - every attribute must be listed here
+    __slots__ = (
+        # Colors and square fills
+        'RGB_WHITE', 'RGB_BLACK', 'LIGHT_SQUARE', 'DARK_SQUARE', 'HIGHLIGHT', 'SELECTED',
+        'TABLE_BORDER', 'TABLE_ROW_BACKGROUNDS',
+        'square_colors', 'selected_square_color',
+        # Settings and help options
+        'settings_file', 'help_options', '_help_options_by_key', 'flip_board_enabled', 'help_overlay_visible',
+        # Animation state
+        'move_animation_piece', 'move_animation_from_square', 'move_animation_to_square',
+        'move_animation_start_time', 'move_animation_duration',
+        'checkmate_animation_start_time', 'checkmate_king_position',
+        # Statistics cache state
+        'cached_activity_white', 'cached_activity_black', 'activity_cache_valid',
+        '_panel_cache_surface', '_panel_cache_key', '_highlight_cache',
+        # UI state
+        'hovered_statistic', 'statistic_table_geometry', 'statistic_row_keys', 'vcr_button_rects',
+        'flip_board_button_rect', 'help_main_button_rect', 'help_button_rect', '_last_button_hover',
+        # Window and layout geometry
+        'window_width', 'window_height', 'board_size', 'square_size', 'board_margin_x', 'board_margin_y',
+        'help_panel_width', 'help_panel_x', 'help_panel_y', 'checkbox_size', 'checkbox_spacing',
+        'vcr_button_size', 'vcr_button_origins', 'stats_table_width', 'stats_table_x', 'stats_row_height',
+        'stats_col_widths', 'stats_table_y', 'captured_piece_size', 'captured_y_above', 'captured_y_below',
+        'square_origins', 'square_iteration', 'coordinate_label_blits', 'indicator_corner_size', 'indicator_font',
+        # Fonts and rendered text
+        'font_large', 'font_medium', 'font_medium_bold', 'font_small', 'font_small_bold',
+        '_font_paths', '_text_cache',
+        # Images and cached surfaces
+        'original_piece_images', 'piece_images', 'piece_images_by_ct', 'mini_piece_images', '_scaled_piece_images',
+        '_piece_images_converted', '_resized_piece_cache',
+        '_rotated_piece_frames',
+        'hanging_glow_surface', 'attacked_glow_surface', 'move_indicator', 'board_background_surface',
+        '_table_grid_surface', '_table_grid_key', '_vcr_button_surfaces', '_vcr_button_surfaces_size',
+        '_fork_arrow_cache', '_stalemate_overlay_blits',
+        '_square_rect', '_checkbox_rect', '_checkbox_shadow_rect', '_check_offsets',
+    )
+
     def __init__(self, window_width: int = 800, window_height: int = 600):
         """Initialize the display with window dimensions"""
         # Ensure pygame is initialized before doing anything
@@ -44,10 +97,21 @@ class ChessDisplay:
         self.DARK_SQUARE = Colors.DARK_SQUARE
         self.HIGHLIGHT = Colors.HIGHLIGHT
         self.SELECTED = Colors.SELECTED
+        self.TABLE_BORDER = Colors.TABLE_BORDER
+        self.TABLE_ROW_BACKGROUNDS = Colors.TABLE_ROW_BACKGROUNDS
+
+        # Board square fills resolved to pygame.Color once: [is_dark][is_last_move]
+        self.square_colors = (
+            (pygame.Color(Colors.LIGHT_SQUARE), pygame.Color(Colors.LIGHT_SQUARE_LAST_MOVE)),
+            (pygame.Color(Colors.DARK_SQUARE), pygame.Color(Colors.DARK_SQUARE_LAST_MOVE)),
+        )
+        self.selected_square_color = pygame.Color(Colors.SELECTED)
 
         # Settings and state that don't depend on window size
         self.settings_file = ".capablanca"
         self.help_options = []  # Removed Flip Board checkbox
+        # Same option dicts keyed by "key" for constant-time lookups; the list keeps drawing order
+        self._help_options_by_key = {option["key"]: option for option in self.help_options}
         self.flip_board_enabled = False
         self.help_overlay_visible = False
 
@@ -65,24 +129,58 @@ class ChessDisplay:
         self.cached_activity_black = 0
         self.activity_cache_valid = False
 
+        # Pre-rendered help panel, reused until the board changes (see invalidate_activity_cache)
+        self._panel_cache_surface = None
+        self._panel_cache_key = None
+
         # UI state variables
         self.hovered_statistic = None
-        self.statistic_cell_rects = {}
+        # Statistics table hit-testing: (table_x, table_y, col1_width, col2_width, col3_width, row_height)
+        # plus the lowercase statistic key of each row, recorded by _draw_panel_statistics
+        self.statistic_table_geometry = None
+        self.statistic_row_keys = ()
         self.vcr_button_rects = {}
         self.flip_board_button_rect = None
         self.help_main_button_rect = None
         self.help_button_rect = None
 
+        # Statistics table borders, keyed by table geometry
+        self._table_grid_surface = None
+        self._table_grid_key = None
+
+        # Prerendered VCR button symbols keyed by (button type, enabled), rebuilt when the size changes
+        self._vcr_button_surfaces = {}
+        self._vcr_button_surfaces_size = None
+
+        # System font files (regular, bold, bold is synthetic), resolved on first use
+        self._font_paths = None
+
+        # Rendered text surfaces keyed by (font id, text, color) - cleared when fonts are recreated
+        self._text_cache = {}
+
+        # Statistic highlight lists keyed by (stat type, position key, color) - cleared when the board changes
+        self._highlight_cache = {}
+
         # Cached surfaces (will be recreated on resize)
         self.hanging_glow_surface = None
-        self.hanging_glow_size = None
+        # Fork arrow surfaces keyed by (origin coords, destination coords, flipped) - cleared on resize
+        self._fork_arrow_cache = {}
+        # Stalemate overlay and stamp as (surface, position) pairs - built on first use after a resize
+        self._stalemate_overlay_blits = None
         self.attacked_glow_surface = None
-        self.attacked_glow_size = None
         self.move_indicator = None
 
         # Store original (unscaled) piece images for resizing
         self.original_piece_images = {}
+        # Scaled (board, captured-strip) piece image sets keyed by square size
+        self._scaled_piece_images = {}
+        self._piece_images_converted = False
         self.piece_images = {}
+        # Same scaled images indexed [color][piece_type] for the per-frame draw paths
+        self.piece_images_by_ct = ([None] * 7, [None] * 7)
+        self.mini_piece_images = ([None] * 7, [None] * 7)
+        # Board-size piece images rescaled to other sizes, keyed by (image key, size)
+        self._resized_piece_cache = {}
 
         # Load original piece images once
         self._load_original_piece_images()
@@ -96,39 +194,21 @@ class ChessDisplay:
     def invalidate_activity_cache(self):
         """Invalidate activity cache when board state changes"""
         self.activity_cache_valid = False
+        self._panel_cache_surface = None
+        self._highlight_cache.clear()
 
     def _load_original_piece_images(self) -> None:
         """Load original unscaled piece images from PNG files (called once)"""
-        # Map piece types to their string representations for filenames
-        piece_symbols = {
-            chess.PAWN: 'P',
-            chess.KNIGHT: 'N',
-            chess.BISHOP: 'B',
-            chess.ROOK: 'R',
-            chess.QUEEN: 'Q',
-            chess.KING: 'K'
-        }
-
-        for color in [chess.WHITE, chess.BLACK]:
-            for piece_type in [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING]:
-                # Create filename based on naming convention: {color}{piece}.png
-                color_prefix = "w" if color == chess.WHITE else "b"
-                piece_symbol = piece_symbols[piece_type]
-                relative_filename = f"images/2x/{color_prefix}{piece_symbol}.png"
-                filename = get_resource_path(relative_filename)
-
-                try:
-                    # Load the original image (don't scale yet)
-                    original_image = pygame.image.load(filename)
-
-                    # Store with the key format: "w1" for white pawn, "b6" for black king, etc.
-                    color_str = "w" if color == chess.WHITE else "b"
-                    key = f"{color_str}{piece_type}"
-                    self.original_piece_images[key] = original_image
-
-                except pygame.error as e:
-                    print(f"Warning: Could not load piece image: {filename}")
-                    print(f"Error: {e}")
+        for key, relative_filename, _ in _PIECE_IMAGE_MANIFEST:
+            filename = get_resource_path(relative_filename)
+
+            try:
+                # Load the original image (don't scale yet)
+                self.original_piece_images[key] = pygame.image.load(filename)
+
+            except pygame.error as e:
+                print(f"Warning: Could not load piece image: {filename}")
+                print(f"Error: {e}")
 
     def _calculate_dimensions(self, window_width: int, window_height: int) -> None:
         """Calculate all dimensions based on window size and create scaled resources"""
@@ -161,57 +241,222 @@ class ChessDisplay:
         # Create fonts at appropriate sizes
         self._create_fonts()
 
+        # Derived per-frame geometry - depends only on window size and fonts
+        self._calculate_layout()
+
         # Scale piece images to match new square size
         self._scale_piece_images()
 
+        # Fork arrows and the stalemate stamp are positioned in window coordinates
+        self._fork_arrow_cache.clear()
+        self._stalemate_overlay_blits = None
+
         # Create move indicator circle surface
         self.move_indicator = self._create_move_indicator()
 
-        # Invalidate cached surfaces so they'll be recreated
-        self.hanging_glow_surface = None
-        self.hanging_glow_size = None
-        self.attacked_glow_surface = None
-        self.attacked_glow_size = None
+        # Piece indicator disks, built once per square size rather than checked every blit
+        self.hanging_glow_surface = self._create_hanging_glow_surface(self.square_size)
+        self.attacked_glow_surface = self._create_attacked_glow_surface(self.square_size)
+
+    def _calculate_layout(self) -> None:
+        """Resolve pixel positions the draw methods would otherwise recompute every frame"""
+        # Statistics table dimensions - reduced size
+        self.stats_table_width = self.help_panel_width - 40  # Increased margin for smaller box
+        self.stats_table_x = self.help_panel_x + 20
+        self.stats_row_height = self.font_medium.get_height() + 6  # Moderate padding for readable rows
+        # Column widths (proportional to table width): statistic name, player score, opponent score
+        self.stats_col_widths = (int(self.stats_table_width * 0.5),
+                                 int(self.stats_table_width * 0.25),
+                                 int(self.stats_table_width * 0.25))
+
+        # Statistics table: 10 rows vertically centered between the panel top padding and VCR controls
+        stats_top = self.help_panel_y + 20
+        total_table_height = 10 * self.stats_row_height
+        vcr_controls_height = self.vcr_button_size + 40  # Button height + padding
+        remaining_vertical_space = self.board_size - (stats_top - self.help_panel_y) - vcr_controls_height
+        self.stats_table_y = stats_top + (remaining_vertical_space - total_table_height) // 2
+
+        # VCR buttons: four in a row at the bottom of the panel, centered
+        button_spacing = 10
+        total_width = 4 * self.vcr_button_size + 3 * button_spacing
+        start_x = self.help_panel_x + (self.help_panel_width - total_width) // 2
+        button_y = self.help_panel_y + self.board_size - self.vcr_button_size - 20
+        self.vcr_button_origins = tuple((start_x + i * (self.vcr_button_size + button_spacing), button_y)
+                                        for i in range(4))
+
+        # Captured pieces: miniature rows above the board and below the file letters
+        self.captured_piece_size = self.square_size // 3
+        self.captured_y_above = self.board_margin_y - self.captured_piece_size - 10
+        self.captured_y_below = self.board_margin_y + self.board_size + 10 + self.font_small.get_height() + 10
+
+        # Top-left pixel of every board square, indexed [is_board_flipped][row * 8 + col]
+        normal_origins = []
+        flipped_origins = []
+        for row in range(8):
+            for col in range(8):
+                normal_origins.append((self.board_margin_x + col * self.square_size,
+                                       self.board_margin_y + row * self.square_size))
+                flipped_origins.append((self.board_margin_x + (7 - col) * self.square_size,
+                                        self.board_margin_y + (7 - row) * self.square_size))
+        self.square_origins = (tuple(normal_origins), tuple(flipped_origins))
+
+        # Full square-pass order per orientation: ((row, col), chess square, square mask, x, y) in row-major order
+        iteration = ([], [])
+        for row in range(8):
+            for col in range(8):
+                square = square_from_coords(row, col)
+                for flipped in (0, 1):
+                    x, y = self.square_origins[flipped][row * 8 + col]
+                    iteration[flipped].append(((row, col), square, chess.BB_SQUARES[square], x, y))
+        self.square_iteration = (tuple(iteration[0]), tuple(iteration[1]))
+
+        # Coordinate labels never change between frames: (surface, rect) pairs per orientation
+        self.coordinate_label_blits = (self._create_coordinate_label_blits(False),
+                                       self._create_coordinate_label_blits(True))
+
+        # Persistent rects the draw methods move into place instead of allocating one per call
+        self._square_rect = pygame.Rect(0, 0, self.square_size, self.square_size)
+        self._checkbox_rect = pygame.Rect(0, 0, self.checkbox_size, self.checkbox_size)
+        self._checkbox_shadow_rect = pygame.Rect(0, 0, self.checkbox_size, self.checkbox_size)
+        # Checkmark polyline as integer offsets (pygame truncates float endpoints the same way)
+        size = self.checkbox_size
+        self._check_offsets = ((int(size * 0.25), int(size * 0.55)),
+                               (int(size * 0.45), int(size * 0.7)),
+                               (int(size * 0.75), int(size * 0.35)))
+
+        # Plain checkerboard, blitted in one call; flipping keeps every square's color, so one serves both views
+        self.board_background_surface = pygame.Surface((8 * self.square_size, 8 * self.square_size))
+        for row in range(8):
+            for col in range(8):
+                self.board_background_surface.fill(self.square_colors[(row + col) & 1][0],
+                                                   (col * self.square_size, row * self.square_size,
+                                                    self.square_size, self.square_size))
+
+        # Pin/skewer badges: circle in the upper left quarter of the square, letter font sized to it
+        self.indicator_corner_size = int(self.square_size * 0.5)  # 50% of square size
+        self.indicator_font = pygame.font.Font(None, int((self.indicator_corner_size // 2) * 1.8))
+
+    def _render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Render antialiased text through the surface cache"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Bounded FIFO: drop the oldest entry once the cache is full
+            if len(self._text_cache) >= 256:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
 
     def _create_fonts(self) -> None:
         """Create fonts at sizes appropriate for current board size"""
-        font_list = 'inter,sfprodisplay,roboto,notosans,opensans,lato,calibri,segoeui,helvetica,arial,sans-serif'
-
+        # Cached text belongs to the old fonts (and their ids may be reused)
+        self._text_cache.clear()
+        large_size = int(self.board_size * GameConfig.FONT_LARGE_PERCENTAGE)
+        medium_size = int(self.board_size * GameConfig.FONT_MEDIUM_PERCENTAGE)
+        small_size = int(self.board_size * GameConfig.FONT_SMALL_PERCENTAGE)
+
+        # A missing family needs no handling here: _system_font then uses the default font.
+        # Only a matched font file that fails to load falls back below.
         try:
             # Try to use modern system fonts
-            self.font_large = pygame.font.SysFont(font_list, int(self.board_size * GameConfig.FONT_LARGE_PERCENTAGE), bold=True)
-            self.font_medium = pygame.font.SysFont(font_list, int(self.board_size * GameConfig.FONT_MEDIUM_PERCENTAGE), bold=False)
-            self.font_medium_bold = pygame.font.SysFont(font_list, int(self.board_size * GameConfig.FONT_MEDIUM_PERCENTAGE), bold=True)
-            self.font_small = pygame.font.SysFont(font_list, int(self.board_size * GameConfig.FONT_SMALL_PERCENTAGE), bold=False)
-            self.font_small_bold = pygame.font.SysFont(font_list, int(self.board_size * GameConfig.FONT_SMALL_PERCENTAGE), bold=True)
-        except:
-            # Fallback to default if system fonts aren't available
-            self.font_large = pygame.font.Font(None, int(self.board_size * GameConfig.FONT_LARGE_PERCENTAGE))
-            self.font_medium = pygame.font.Font(None, int(self.board_size * GameConfig.FONT_MEDIUM_PERCENTAGE))
-            self.font_medium_bold = pygame.font.Font(None, int(self.board_size * GameConfig.FONT_MEDIUM_PERCENTAGE))
-            self.font_small = pygame.font.Font(None, int(self.board_size * GameConfig.FONT_SMALL_PERCENTAGE))
-            self.font_small_bold = pygame.font.Font(None, int(self.board_size * GameConfig.FONT_SMALL_PERCENTAGE))
+            self.font_large = self._system_font(large_size, bold=True)
+            self.font_medium = self._system_font(medium_size, bold=False)
+            self.font_medium_bold = self._system_font(medium_size, bold=True)
+            self.font_small = self._system_font(small_size, bold=False)
+            self.font_small_bold = self._system_font(small_size, bold=True)
+        except (OSError, pygame.error):
+            # Fallback to default if the system font files can't be loaded
+            self.font_large = pygame.font.Font(None, large_size)
+            self.font_medium = pygame.font.Font(None, medium_size)
+            self.font_medium_bold = pygame.font.Font(None, medium_size)
+            self.font_small = pygame.font.Font(None, small_size)
+            self.font_small_bold = pygame.font.Font(None, small_size)
+
+    def _system_font(self, size: int, bold: bool) -> pygame.font.Font:
+        """Create a font from the preferred system family (same result as pygame.font.SysFont)"""
+        # Resolve the font files once; every resize only needs new sizes
+        if self._font_paths is None:
+            font_list = 'inter,sfprodisplay,roboto,notosans,opensans,lato,calibri,segoeui,helvetica,arial,sans-serif'
+            regular_path = pygame.font.match_font(font_list)
+            bold_path = pygame.font.match_font(font_list, bold=True)
+            # Without a distinct bold face the regular one is emboldened, as SysFont does
+            self._font_paths = (regular_path, bold_path, bold_path is None or bold_path == regular_path)
+
+        regular_path, bold_path, synthetic_bold = self._font_paths
+        font = pygame.font.Font(bold_path if bold else regular_path, size)
+        if bold and synthetic_bold:
+            font.set_bold(True)
+        return font
 
     def _scale_piece_images(self) -> None:
         """Scale piece images to match current square size"""
+        # Pre-rotated and resized frames belong to the previous size
+        self._rotated_piece_frames = {}
+        self._resized_piece_cache = {}
+
+        # convert_alpha() needs an active display; until one exists the images stay unconverted
+        if not self._piece_images_converted and pygame.display.get_surface() is not None:
+            self._convert_piece_images()
+
+        # Resizing back to a size seen before reuses its scaled set instead of resampling again
+        cached = self._scaled_piece_images.get(self.square_size)
+        if cached is not None:
+            self.piece_images, self.piece_images_by_ct, self.mini_piece_images = cached
+            return
+
         self.piece_images = {}
+        self.piece_images_by_ct = ([None] * 7, [None] * 7)
+        self.mini_piece_images = ([None] * 7, [None] * 7)
+        self._scaled_piece_images[self.square_size] = (self.piece_images, self.piece_images_by_ct,
+                                                       self.mini_piece_images)
+
+        mini_size = self.captured_piece_size
+        mini_pawn_size = int(mini_size * 0.7)  # Captured pawns 30% smaller
+        for key, _, size_factor in _PIECE_IMAGE_MANIFEST:
+            original_image = self.original_piece_images.get(key)
+            if original_image is None:
+                continue
 
-        for key, original_image in self.original_piece_images.items():
-            # Determine piece type from key (e.g., "w1" -> 1 = PAWN)
-            piece_type = int(key[1])
+            # Scale and cache the image (pawns smaller than other pieces)
+            piece_size = int(self.square_size * size_factor)
+            piece_image = pygame.transform.smoothscale(original_image, (piece_size, piece_size))
+            self.piece_images[key] = piece_image
+            color = key[0] == "w"
+            piece_type = int(key[1:])
+            self.piece_images_by_ct[color][piece_type] = piece_image
+
+            # Captured-strip miniature with its vertical offset (pawns centered in the row)
+            size = mini_pawn_size if piece_type == chess.PAWN else mini_size
+            self.mini_piece_images[color][piece_type] = (pygame.transform.smoothscale(piece_image, (size, size)),
+                                                         (mini_size - size) // 2)
+
+    def _get_resized_piece(self, key: str, size: int) -> pygame.Surface:
+        """Get the piece image for key smoothscaled to size x size, scaling only on first use"""
+        cache_key = (key, size)
+        surface = self._resized_piece_cache.get(cache_key)
+        if surface is None:
+            surface = pygame.transform.smoothscale(self.piece_images[key], (size, size))
+            self._resized_piece_cache[cache_key] = surface
+        return surface
 
-            # Calculate piece size based on type (pawns smaller than other pieces)
-            if piece_type == chess.PAWN:
-                piece_size = int(self.square_size * GameConstants.PAWN_SIZE_FACTOR)
-            else:
-                piece_size = int(self.square_size * GameConstants.PIECE_SIZE_FACTOR)
+    def _convert_piece_images(self) -> None:
+        """Convert the original piece images to the display's pixel format (called once a display exists)"""
+        # smoothscale keeps the source format, so every scaled piece blits without per-frame conversion
+        for key, original_image in self.original_piece_images.items():
+            self.original_piece_images[key] = original_image.convert_alpha()
 
-            # Scale and cache the image
-            scaled_image = pygame.transform.smoothscale(original_image, (piece_size, piece_size))
-            self.piece_images[key] = scaled_image
+        # Sets scaled from the unconverted images are stale
+        self._scaled_piece_images.clear()
+        self._piece_images_converted = True
 
     def resize(self, window_width: int, window_height: int) -> None:
         """Resize the display to new window dimensions"""
+        # The resolved layout depends only on the window size; set_mode() after a
+        # VIDEORESIZE often reports the size we already have, so skip the rebuild
+        if (window_width, window_height) == (self.window_width, self.window_height):
+            return
+
         # Recalculate all dimensions and recreate scaled resources
         self._calculate_dimensions(window_width, window_height)
 
@@ -221,7 +466,25 @@ class ChessDisplay:
     def draw_vcr_button(self, screen, x: int, y: int, button_type: str, enabled: bool = True) -> pygame.Rect:
         """Draw a VCR control button and return its rectangle"""
         size = self.vcr_button_size
-        button_rect = pygame.Rect(x, y, size, size)
+
+        # Symbols are rasterized once per (type, enabled) and size, then blitted
+        if self._vcr_button_surfaces_size != size:
+            self._vcr_button_surfaces = {}
+            self._vcr_button_surfaces_size = size
+        key = (button_type, enabled)
+        surface = self._vcr_button_surfaces.get(key)
+        if surface is None:
+            surface = self._create_vcr_button_surface(button_type, enabled)
+            self._vcr_button_surfaces[key] = surface
+
+        screen.blit(surface, (x, y))
+        return pygame.Rect(x, y, size, size)
+
+    def _create_vcr_button_surface(self, button_type: str, enabled: bool) -> pygame.Surface:
+        """Create a transparent surface holding a VCR button symbol"""
+        size = self.vcr_button_size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        x = y = 0
 
         # Symbol color (black if enabled, light grey if disabled)
         symbol_color = (0, 0, 0) if enabled else (200, 200, 200)
@@ -232,7 +495,7 @@ class ChessDisplay:
             # Double left arrow (|<<)
             # Draw bar
             bar_x = x + padding
-            pygame.draw.rect(screen, symbol_color, (bar_x, y + padding, 2, size - 2*padding))
+            pygame.draw.rect(surface, symbol_color, (bar_x, y + padding, 2, size - 2*padding))
             # Draw double triangles
             tri1_x = bar_x + 4
             tri2_x = tri1_x + (size - 2*padding) // 2
@@ -242,7 +505,7 @@ class ChessDisplay:
                     (tri_x, y + size // 2),
                     (tri_x + (size - 2*padding) // 2, y + size - padding)
                 ]
-                pygame.draw.polygon(screen, symbol_color, points)
+                pygame.draw.polygon(surface, symbol_color, points)
 
         elif button_type == "back":
             # Single left arrow (<)
@@ -252,7 +515,7 @@ class ChessDisplay:
                 (mid_x - padding, y + size // 2),
                 (mid_x + padding, y + size - padding)
             ]
-            pygame.draw.polygon(screen, symbol_color, points)
+            pygame.draw.polygon(surface, symbol_color, points)
 
         elif button_type == "forward":
             # Single right arrow (>)
@@ -262,7 +525,7 @@ class ChessDisplay:
                 (mid_x + padding, y + size // 2),
                 (mid_x - padding, y + size - padding)
             ]
-            pygame.draw.polygon(screen, symbol_color, points)
+            pygame.draw.polygon(surface, symbol_color, points)
 
         elif button_type == "fast_forward":
             # Double right arrow (>>|)
@@ -275,12 +538,12 @@ class ChessDisplay:
                     (tri_x + (size - 2*padding) // 2, y + size // 2),
                     (tri_x, y + size - padding)
                 ]
-                pygame.draw.polygon(screen, symbol_color, points)
+                pygame.draw.polygon(surface, symbol_color, points)
             # Draw bar
             bar_x = x + size - padding - 2
-            pygame.draw.rect(screen, symbol_color, (bar_x, y + padding, 2, size - 2*padding))
+            pygame.draw.rect(surface, symbol_color, (bar_x, y + padding, 2, size - 2*padding))
 
-        return button_rect
+        return surface
     
     def _create_move_indicator(self) -> pygame.Surface:
         """Create a translucent circle surface for move indicators"""
@@ -300,48 +563,44 @@ class ChessDisplay:
 
     def draw_help_panel(self, screen, board_state=None, is_board_flipped=False) -> None:
         """Draw the help panel on the right side of the board with statistics"""
-        # Draw panel background (optional - subtle background)
         panel_rect = pygame.Rect(self.help_panel_x, self.help_panel_y,
                                self.help_panel_width, self.board_size)
+
+        # Reuse the pre-rendered panel while the same position is shown the same way up.
+        # Keyed by position rather than object, so a move preview (a fresh copy every frame)
+        # hits the cache too; undo/redo availability decides the VCR button states.
+        if board_state:
+            panel_key = (board_state.position_key(), is_board_flipped,
+                         board_state.can_undo(), board_state.can_redo())
+        else:
+            panel_key = (None, is_board_flipped)
+        if self._panel_cache_surface is not None and self._panel_cache_key == panel_key:
+            screen.blit(self._panel_cache_surface, panel_rect)
+            return
+
+        # Draw panel background (optional - subtle background)
         pygame.draw.rect(screen, Colors.HELP_PANEL_BACKGROUND, panel_rect)
         pygame.draw.rect(screen, Colors.RGB_BLACK, panel_rect, 1)
 
-        # Start position for statistics (no checkboxes at top anymore)
-        current_y = self.help_panel_y + 20
-
         # Draw statistics if board_state is provided
         if board_state:
-            # Calculate vertical centering for statistics table
-            # 10 rows in the table, calculate total height needed
-            stats_row_height = self.font_medium.get_height() + 6
-            total_table_height = 10 * stats_row_height
-
-            # Calculate space for VCR controls at bottom
-            vcr_controls_height = self.vcr_button_size + 40  # Button height + padding
-
-            # Center the table in the remaining vertical space (excluding VCR controls)
-            remaining_vertical_space = self.board_size - (current_y - self.help_panel_y) - vcr_controls_height
-            centered_start_y = current_y + (remaining_vertical_space - total_table_height) // 2
-
-            self._draw_panel_statistics(screen, board_state, is_board_flipped, centered_start_y)
+            # Table position is resolved once per window size in _calculate_layout()
+            self._draw_panel_statistics(screen, board_state, is_board_flipped, self.stats_table_y)
 
             # Draw VCR controls at the bottom
             self._draw_vcr_controls(screen, board_state)
 
+        # The panel paints over its whole rect, so a copy of that region is the complete panel
+        self._panel_cache_surface = screen.subsurface(panel_rect.clip(screen.get_rect())).copy()
+        self._panel_cache_key = panel_key
+
     def _draw_panel_statistics(self, screen, board_state, is_board_flipped: bool, start_y: int) -> None:
         """Draw activity and pawn statistics in spreadsheet-style table format"""
-        # Clear previous cell rectangles
-        self.statistic_cell_rects = {}
-
-        # Table dimensions - reduced size
-        table_width = self.help_panel_width - 40  # Increased margin for smaller box
-        table_x = self.help_panel_x + 20
-        row_height = self.font_medium.get_height() + 6  # Moderate padding for readable rows
-
-        # Column widths (proportional to table width)
-        col1_width = int(table_width * 0.5)   # Statistic name (left)
-        col2_width = int(table_width * 0.25)  # Player score (center)
-        col3_width = int(table_width * 0.25)  # Opponent score (center)
+        # Table dimensions, resolved once per resize by _calculate_layout
+        table_width = self.stats_table_width
+        table_x = self.stats_table_x
+        row_height = self.stats_row_height
+        col1_width, col2_width, col3_width = self.stats_col_widths
 
         # Gather all statistics data
         white_activity, black_activity = board_state.get_activity_scores()
@@ -404,97 +663,94 @@ class ChessDisplay:
 
         current_y = start_y
 
+        # Text surfaces are queued and blitted in one batch after the row backgrounds and borders
+        text_blits = []
+
+        # Hot lookups bound once for the row loop
+        render_text = self._render_text
+        font_medium, font_medium_bold = self.font_medium, self.font_medium_bold
+        fill = screen.fill
+        queue_blit = text_blits.append
+        row_backgrounds, text_color = self.TABLE_ROW_BACKGROUNDS, self.RGB_BLACK
+
         # Draw each row
         for row_name, player_val, opponent_val, higher_is_better in table_data:
             # Determine row background color based on favorability
-            if player_val == opponent_val:
-                row_bg_color = Colors.TABLE_NEUTRAL_BG
-            elif higher_is_better:
-                # For Activity and Pawns: higher is better
-                if player_val > opponent_val:
-                    row_bg_color = Colors.TABLE_FAVORABLE_BG
-                else:
-                    row_bg_color = Colors.TABLE_UNFAVORABLE_BG
-            else:
-                # For Backward, Isolated, Doubled: lower is better
-                if player_val < opponent_val:
-                    row_bg_color = Colors.TABLE_FAVORABLE_BG
-                else:
-                    row_bg_color = Colors.TABLE_UNFAVORABLE_BG
-
-            # Draw row background
-            row_rect = pygame.Rect(table_x, current_y, table_width, row_height)
-            pygame.draw.rect(screen, row_bg_color, row_rect)
-
-            # Draw cell borders (faint gray)
-            # Top border
-            pygame.draw.line(screen, Colors.TABLE_BORDER,
-                           (table_x, current_y), (table_x + table_width, current_y))
-            # Left border
-            pygame.draw.line(screen, Colors.TABLE_BORDER,
-                           (table_x, current_y), (table_x, current_y + row_height))
-            # Vertical separators
-            pygame.draw.line(screen, Colors.TABLE_BORDER,
-                           (table_x + col1_width, current_y), (table_x + col1_width, current_y + row_height))
-            pygame.draw.line(screen, Colors.TABLE_BORDER,
-                           (table_x + col1_width + col2_width, current_y),
-                           (table_x + col1_width + col2_width, current_y + row_height))
-            # Right border
-            pygame.draw.line(screen, Colors.TABLE_BORDER,
-                           (table_x + table_width, current_y), (table_x + table_width, current_y + row_height))
+            # Activity and Pawns: higher is better; Backward, Isolated, Doubled: lower is better
+            margin = player_val - opponent_val if higher_is_better else opponent_val - player_val
+            row_bg_color = row_backgrounds[(margin > 0) - (margin < 0) + 1]
+
+            # Draw row background (the grid is overlaid once all rows are filled)
+            fill(row_bg_color, (table_x, current_y, table_width, row_height))
 
             # Column 1: Statistic name (left-aligned)
-            name_surface = self.font_medium.render(row_name, True, Colors.RGB_BLACK)
+            name_surface = render_text(font_medium, row_name, text_color)
             name_x = table_x + 5  # 5px padding from left
             name_y = current_y + (row_height - name_surface.get_height()) // 2
-            screen.blit(name_surface, (name_x, name_y))
+            queue_blit((name_surface, (name_x, name_y)))
 
             # Column 2: Player value (center-aligned)
             # Use red bold font if this is Hanging row and value > 0
             if row_name == "Hanging" and player_val > 0:
-                player_surface = self.font_medium_bold.render(str(player_val), True, (255, 0, 0))
+                player_surface = render_text(font_medium_bold, str(player_val), (255, 0, 0))
             else:
-                player_surface = self.font_medium.render(str(player_val), True, Colors.RGB_BLACK)
+                player_surface = render_text(font_medium, str(player_val), text_color)
             player_x = table_x + col1_width + (col2_width - player_surface.get_width()) // 2
             player_y = current_y + (row_height - player_surface.get_height()) // 2
-            screen.blit(player_surface, (player_x, player_y))
+            queue_blit((player_surface, (player_x, player_y)))
 
             # Column 3: Opponent value (center-aligned)
             # Use red bold font if this is Hanging row and value > 0
             if row_name == "Hanging" and opponent_val > 0:
-                opponent_surface = self.font_medium_bold.render(str(opponent_val), True, (255, 0, 0))
+                opponent_surface = render_text(font_medium_bold, str(opponent_val), (255, 0, 0))
             else:
-                opponent_surface = self.font_medium.render(str(opponent_val), True, Colors.RGB_BLACK)
+                opponent_surface = render_text(font_medium, str(opponent_val), text_color)
             opponent_x = table_x + col1_width + col2_width + (col3_width - opponent_surface.get_width()) // 2
             opponent_y = current_y + (row_height - opponent_surface.get_height()) // 2
-            screen.blit(opponent_surface, (opponent_x, opponent_y))
-
-            # Store cell rectangles for hover detection
-            player_cell_rect = pygame.Rect(table_x + col1_width, current_y, col2_width, row_height)
-            opponent_cell_rect = pygame.Rect(table_x + col1_width + col2_width, current_y, col3_width, row_height)
-
-            # Use lowercase for consistent key names
-            stat_key = row_name.lower()
-            self.statistic_cell_rects[f"{stat_key}_player"] = player_cell_rect
-            self.statistic_cell_rects[f"{stat_key}_opponent"] = opponent_cell_rect
+            queue_blit((opponent_surface, (opponent_x, opponent_y)))
 
             current_y += row_height
 
-        # Draw bottom border of the table
-        pygame.draw.line(screen, Colors.TABLE_BORDER,
-                       (table_x, current_y), (table_x + table_width, current_y))
+        # Record the grid for hover detection (update_statistics_hover works out the cell arithmetically)
+        # Use lowercase for consistent key names
+        self.statistic_table_geometry = (table_x, start_y, col1_width, col2_width, col3_width, row_height)
+        self.statistic_row_keys = tuple(row[0].lower() for row in table_data)
+
+        # Cell borders never change between frames, so the whole grid is a single blit
+        screen.blit(self._get_table_grid_surface(table_width, row_height, col1_width, col2_width, len(table_data)),
+                    (table_x, start_y))
+
+        # One Python->C call for every cell text (Surface.blits)
+        screen.blits(text_blits, doreturn=False)
+
+    def _get_table_grid_surface(self, table_width: int, row_height: int, col1_width: int, col2_width: int,
+                                row_count: int) -> pygame.Surface:
+        """Get the transparent surface holding the statistics table borders, rebuilt when the geometry changes"""
+        key = (table_width, row_height, col1_width, col2_width, row_count)
+        if self._table_grid_key == key:
+            return self._table_grid_surface
+
+        table_height = row_count * row_height
+        grid = pygame.Surface((table_width + 1, table_height + 1), pygame.SRCALPHA)
+
+        # Draw cell borders (faint gray)
+        # Outer frame as one 1px rect outline, then the inner row and column separators
+        pygame.draw.rect(grid, self.TABLE_BORDER, (0, 0, table_width + 1, table_height + 1), 1)
+        for row in range(1, row_count):
+            y = row * row_height
+            pygame.draw.line(grid, self.TABLE_BORDER, (0, y), (table_width, y))
+        for x in (col1_width, col1_width + col2_width):
+            pygame.draw.line(grid, self.TABLE_BORDER, (x, 0), (x, table_height))
+
+        self._table_grid_surface = grid
+        self._table_grid_key = key
+        return grid
 
     def _draw_vcr_controls(self, screen, board_state) -> None:
         """Draw VCR control buttons at the bottom of the help panel"""
         # Clear previous button rectangles
         self.vcr_button_rects = {}
 
-        # Position buttons at the bottom of the panel, centered
-        button_spacing = 10
-        total_width = 4 * self.vcr_button_size + 3 * button_spacing
-        start_x = self.help_panel_x + (self.help_panel_width - total_width) // 2
-        button_y = self.help_panel_y + self.board_size - self.vcr_button_size - 20
-
         # Determine button states
         can_undo = board_state.can_undo()
         can_redo = board_state.can_redo()
@@ -512,25 +768,29 @@ class ChessDisplay:
             ("fast_forward", can_fast_forward)
         ]
 
-        current_x = start_x
-        for button_type, enabled in buttons:
-            rect = self.draw_vcr_button(screen, current_x, button_y, button_type, enabled)
+        # Button positions come from _calculate_layout
+        for (button_type, enabled), (x, y) in zip(buttons, self.vcr_button_origins):
+            rect = self.draw_vcr_button(screen, x, y, button_type, enabled)
             self.vcr_button_rects[button_type] = rect
-            current_x += self.vcr_button_size + button_spacing
 
     def update_statistics_hover(self, mouse_pos: tuple) -> None:
         """Update which statistic cell is being hovered"""
         self.hovered_statistic = None
+        if self.statistic_table_geometry is None:
+            return
 
-        for cell_key, cell_rect in self.statistic_cell_rects.items():
-            if cell_rect.collidepoint(mouse_pos):
-                # Parse the cell key (e.g., "activity_player" -> ("activity", "player"))
-                parts = cell_key.split('_')
-                if len(parts) >= 2:
-                    stat_type = parts[0]
-                    player_side = parts[1]
-                    self.hovered_statistic = (stat_type, player_side)
-                break
+        # The table is a regular grid, so the hovered cell is plain arithmetic
+        table_x, table_y, col1_width, col2_width, col3_width, row_height = self.statistic_table_geometry
+        x, y = mouse_pos
+        row = (y - table_y) // row_height
+        if not 0 <= row < len(self.statistic_row_keys):
+            return
+
+        dx = x - (table_x + col1_width)
+        if 0 <= dx < col2_width:
+            self.hovered_statistic = (self.statistic_row_keys[row], "player")
+        elif col2_width <= dx < col2_width + col3_width:
+            self.hovered_statistic = (self.statistic_row_keys[row], "opponent")
 
     def get_highlighted_pieces_for_statistic(self, board_state, stat_type: str, player_side: str, is_board_flipped: bool):
         """Get pieces or squares to highlight based on the hovered statistic"""
@@ -547,6 +807,16 @@ class ChessDisplay:
 
         target_color = player_color if player_side == "player" else opponent_color
 
+        # Every statistic is a pure function of the position, so hovering again is a dict lookup
+        key = (stat_type, board_state.position_key(), target_color)
+        highlighted = self._highlight_cache.get(key)
+        if highlighted is None:
+            highlighted = self._compute_highlighted_pieces(board_state, stat_type, target_color)
+            self._highlight_cache[key] = highlighted
+        return highlighted
+
+    def _compute_highlighted_pieces(self, board_state, stat_type: str, target_color: bool):
+        """Dispatch a statistic type to its piece/square collector"""
         if stat_type == "activity":
             return self._get_activity_squares(board_state, target_color)
         elif stat_type == "developed":
@@ -572,98 +842,46 @@ class ChessDisplay:
 
     def _get_activity_squares(self, board_state, color: bool):
         """Get all squares that pieces of this color can legally reach"""
-        reachable_squares = set()
-
-        # Save current turn
-        original_turn = board_state.board.turn
-
-        # Set turn to the color we're checking
-        board_state.board.turn = color
-
-        # Only count squares that pieces can legally reach
-        for move in board_state.board.legal_moves:
-            piece = board_state.board.piece_at(move.from_square)
-            if piece and piece.color == color and piece.piece_type != chess.PAWN:
-                reachable_squares.add(coords_from_square(move.to_square))
-
-        # Restore original turn
-        board_state.board.turn = original_turn
-
-        return list(reachable_squares)
+        # BITBOARD: Reachable squares come from the position's analysis, no turn flipping here
+        reachable = board_state.get_reachable_squares(color)
+        return [_COORDS_FROM_SQUARE[sq] for sq in chess.scan_forward(reachable)]
 
     def _get_developed_pieces(self, board_state, color: bool):
         """Get all developed pieces of this color"""
-        developed_pieces = []
+        board = board_state.board
+        king_start = chess.E1 if color == chess.WHITE else chess.E8
 
-        if color == chess.WHITE:
-            starting_rank = 0  # rank 1
-            king_start = chess.E1
-        else:
-            starting_rank = 7  # rank 8
-            king_start = chess.E8
+        # BITBOARD: Same rules as BoardState._count_developed, collecting squares instead of a count
+        back_rank = chess.BB_RANK_1 if color == chess.WHITE else chess.BB_RANK_8
+        own_bb = board.occupied_co[color]
 
         # Knights, bishops, queen: off back rank = developed
-        for piece_type in [chess.KNIGHT, chess.BISHOP, chess.QUEEN]:
-            for square in chess.SQUARES:
-                piece = board_state.board.piece_at(square)
-                if piece and piece.color == color and piece.piece_type == piece_type:
-                    if chess.square_rank(square) != starting_rank:
-                        developed_pieces.append(coords_from_square(square))
+        developed_bb = (board.knights | board.bishops | board.queens) & own_bb & ~back_rank
 
         # King: developed if castled (not on starting square)
-        king_square = board_state.board.king(color)
+        king_square = board.king(color)
         if king_square != king_start:
-            developed_pieces.append(coords_from_square(king_square))
+            developed_bb |= chess.BB_SQUARES[king_square]
 
         # Rooks: developed if moved OR if rooks are connected
-        rook_squares = []
-        for square in chess.SQUARES:
-            piece = board_state.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.ROOK:
-                rook_squares.append(square)
-
-        # Check if rooks are connected
-        rooks_connected = False
-        if len(rook_squares) == 2:
-            r1, r2 = rook_squares
-            if chess.square_rank(r1) == starting_rank and chess.square_rank(r2) == starting_rank:
-                file1, file2 = chess.square_file(r1), chess.square_file(r2)
-                min_file, max_file = min(file1, file2), max(file1, file2)
-                pieces_between = False
-                for file in range(min_file + 1, max_file):
-                    check_square = chess.square(file, starting_rank)
-                    if board_state.board.piece_at(check_square):
-                        pieces_between = True
-                        break
-                if not pieces_between:
-                    rooks_connected = True
-
-        # Add developed rooks to list
-        for rook_square in rook_squares:
-            if chess.square_rank(rook_square) != starting_rank:
-                developed_pieces.append(coords_from_square(rook_square))
-            elif rooks_connected:
-                developed_pieces.append(coords_from_square(rook_square))
-
-        return developed_pieces
+        rooks = board.rooks & own_bb
+        developed_bb |= rooks & ~back_rank
+        if chess.popcount(rooks) == 2 and rooks & back_rank == rooks:
+            if not chess.between(chess.lsb(rooks), chess.msb(rooks)) & board.occupied:
+                developed_bb |= rooks
+
+        return [_COORDS_FROM_SQUARE[sq] for sq in chess.scan_forward(developed_bb)]
 
     def _get_attacked_pieces(self, board_state, color: bool):
         """Get all pieces of this color that are attacked by the enemy"""
-        attacked_pieces = []
-        enemy_color = not color
-
-        for square in chess.SQUARES:
-            piece = board_state.board.piece_at(square)
-            if piece and piece.color == color:
-                if board_state.board.is_attacked_by(enemy_color, square):
-                    attacked_pieces.append(coords_from_square(square))
-
-        return attacked_pieces
+        # Same analysis list the statistics panel counts
+        attacked_squares = board_state.get_attacked_pieces(color)
+        return [_COORDS_FROM_SQUARE[sq] for sq in attacked_squares]
 
     def _get_hanging_pieces(self, board_state, color: bool):
         """Get all hanging pieces of this color"""
         hanging_squares = board_state.get_hanging_pieces(color)
-        return [coords_from_square(sq) for sq in hanging_squares]
+        return [_COORDS_FROM_SQUARE[sq] for sq in hanging_squares]
 
     def _get_incursion_pieces(self, board_state, color: bool):
         """
@@ -671,117 +889,29 @@ class ChessDisplay:
         For white: white pieces on ranks 5-8
         For black: black pieces on ranks 1-4
         """
-        incursion_pieces = []
-
-        if color == chess.WHITE:
-            # White's incursions: white pieces on ranks 5-8 (squares 32-63)
-            for square in range(32, 64):
-                piece = board_state.board.piece_at(square)
-                if piece and piece.color == color:
-                    incursion_pieces.append(coords_from_square(square))
-        else:
-            # Black's incursions: black pieces on ranks 1-4 (squares 0-31)
-            for square in range(32):
-                piece = board_state.board.piece_at(square)
-                if piece and piece.color == color:
-                    incursion_pieces.append(coords_from_square(square))
-
-        return incursion_pieces
+        # BITBOARD: Same mask count_incursions counts
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.get_incursion_pieces(color)]
 
     def _get_pawn_pieces(self, board_state, color: bool):
         """Get all pawn pieces of this color"""
-        pawn_pieces = []
-        for square in chess.SQUARES:
-            piece = board_state.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.PAWN:
-                pawn_pieces.append(coords_from_square(square))
-        return pawn_pieces
+        # BITBOARD: One pawn mask instead of a piece_at probe per square
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.board.pieces(chess.PAWN, color)]
 
     def _get_backward_pawn_pieces(self, board_state, color: bool):
         """Get backward pawn pieces of this color - uses cached analysis from board_state"""
-        board_state._ensure_analysis()
-        backward_list = board_state._analysis['white_backward' if color == chess.WHITE else 'black_backward']
-        return [coords_from_square(sq) for sq in backward_list]
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.get_backward_pawns(color)]
 
     def _get_isolated_pawn_pieces(self, board_state, color: bool):
-        """Get isolated pawn pieces of this color"""
-        isolated_pawns = []
-        for square in chess.SQUARES:
-            piece = board_state.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.PAWN:
-                # Check if there are friendly pawns on adjacent files
-                file = chess.square_file(square)
-                has_adjacent_pawn = False
-                for adjacent_file in [file - 1, file + 1]:
-                    if 0 <= adjacent_file < 8:
-                        for check_rank in range(8):
-                            check_square = chess.square(adjacent_file, check_rank)
-                            adjacent_piece = board_state.board.piece_at(check_square)
-                            if adjacent_piece and adjacent_piece.color == color and adjacent_piece.piece_type == chess.PAWN:
-                                has_adjacent_pawn = True
-                                break
-                        if has_adjacent_pawn:
-                            break
-
-                if not has_adjacent_pawn:
-                    isolated_pawns.append(coords_from_square(square))
-
-        return isolated_pawns
+        """Get isolated pawn pieces of this color - uses cached analysis from board_state"""
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.get_isolated_pawns(color)]
 
     def _get_doubled_pawn_pieces(self, board_state, color: bool):
-        """Get doubled pawn pieces of this color"""
-        doubled_pawns = []
-        # Count pawns per file and identify doubled ones
-        for file in range(8):
-            pawns_on_file = []
-            for rank in range(8):
-                square = chess.square(file, rank)
-                piece = board_state.board.piece_at(square)
-                if piece and piece.color == color and piece.piece_type == chess.PAWN:
-                    pawns_on_file.append(coords_from_square(square))
-
-            # If more than one pawn on this file, highlight ALL of them
-            if len(pawns_on_file) > 1:
-                doubled_pawns.extend(pawns_on_file)  # Add all pawns on doubled files
-
-        return doubled_pawns
+        """Get doubled pawn pieces of this color - uses cached analysis from board_state"""
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.get_doubled_pawns(color)]
 
     def _get_passed_pawn_pieces(self, board_state, color: bool):
-        """Get passed pawn pieces of this color"""
-        passed_pawns = []
-        enemy_color = not color
-        promotion_direction = 1 if color == chess.WHITE else -1
-
-        # Check each pawn
-        for square in chess.SQUARES:
-            piece = board_state.board.piece_at(square)
-            if piece and piece.color == color and piece.piece_type == chess.PAWN:
-                rank = chess.square_rank(square)
-                file = chess.square_file(square)
-
-                # Check if this pawn is passed
-                is_passed = True
-
-                # Check the path to promotion on this file and adjacent files
-                for check_file in [file - 1, file, file + 1]:
-                    if 0 <= check_file <= 7:  # Valid file
-                        # Check all squares from current position to promotion rank
-                        check_rank = rank + promotion_direction
-                        while 0 <= check_rank <= 7:
-                            check_square = chess.square(check_file, check_rank)
-                            enemy_piece = board_state.board.piece_at(check_square)
-                            if enemy_piece and enemy_piece.color == enemy_color and enemy_piece.piece_type == chess.PAWN:
-                                is_passed = False
-                                break
-                            check_rank += promotion_direction
-
-                        if not is_passed:
-                            break
-
-                if is_passed:
-                    passed_pawns.append(coords_from_square(square))
-
-        return passed_pawns
+        """Get passed pawn pieces of this color - uses cached analysis from board_state"""
+        return [_COORDS_FROM_SQUARE[sq] for sq in board_state.get_passed_pawns(color)]
 
     def _draw_checkbox(self, screen, x: int, y: int, option: dict) -> None:
         """Draw a single stylish checkbox with label"""
@@ -789,11 +919,13 @@ class ChessDisplay:
         corner_radius = 4
 
         # Draw shadow (slightly offset)
-        shadow_rect = pygame.Rect(x + 2, y + 2, self.checkbox_size, self.checkbox_size)
+        shadow_rect = self._checkbox_shadow_rect
+        shadow_rect.topleft = (x + 2, y + 2)
         pygame.draw.rect(screen, Colors.CHECKBOX_SHADOW, shadow_rect, border_radius=corner_radius)
 
         # Main checkbox background
-        checkbox_rect = pygame.Rect(x, y, self.checkbox_size, self.checkbox_size)
+        checkbox_rect = self._checkbox_rect
+        checkbox_rect.topleft = (x, y)
         if option["enabled"]:
             # Filled background when checked
             pygame.draw.rect(screen, Colors.ANNOTATION_POSITIVE, checkbox_rect, border_radius=corner_radius)
@@ -810,19 +942,17 @@ class ChessDisplay:
             # Draw a more refined checkmark
             check_color = Colors.RGB_WHITE
             check_thickness = 3
-            # Smoother checkmark coordinates
-            check_x1 = x + self.checkbox_size * 0.25
-            check_y1 = y + self.checkbox_size * 0.55
-            check_x2 = x + self.checkbox_size * 0.45
-            check_y2 = y + self.checkbox_size * 0.7
-            check_x3 = x + self.checkbox_size * 0.75
-            check_y3 = y + self.checkbox_size * 0.35
+            # Smoother checkmark coordinates, precomputed per checkbox size
+            (dx1, dy1), (dx2, dy2), (dx3, dy3) = self._check_offsets
+            check_start = (x + dx1, y + dy1)
+            check_corner = (x + dx2, y + dy2)
+            check_end = (x + dx3, y + dy3)
 
-            pygame.draw.line(screen, check_color, (check_x1, check_y1), (check_x2, check_y2), check_thickness)
-            pygame.draw.line(screen, check_color, (check_x2, check_y2), (check_x3, check_y3), check_thickness)
+            pygame.draw.line(screen, check_color, check_start, check_corner, check_thickness)
+            pygame.draw.line(screen, check_color, check_corner, check_end, check_thickness)
 
         # Draw label with better styling
-        label_text = self.font_small.render(option["name"], True, Colors.LABEL_TEXT_COLOR)
+        label_text = self._render_text(self.font_small, option["name"], Colors.LABEL_TEXT_COLOR)
         label_x = x + self.checkbox_size + 12
         label_y = y + (self.checkbox_size - label_text.get_height()) // 2
         screen.blit(label_text, (label_x, label_y))
@@ -834,7 +964,7 @@ class ChessDisplay:
         current_y = self.help_panel_y + 20  # Starting y position for checkboxes (matches drawing)
         for option in self.help_options:
             # Create expanded clickable area that includes both checkbox and text label
-            label_text = self.font_small.render(option["name"], True, Colors.LABEL_TEXT_COLOR)
+            label_text = self._render_text(self.font_small, option["name"], Colors.LABEL_TEXT_COLOR)
             label_width = label_text.get_width()
 
             # Clickable area extends from checkbox to end of text label
@@ -860,22 +990,20 @@ class ChessDisplay:
             self._save_settings()
             return self.flip_board_enabled
 
-        for option in self.help_options:
-            if option["key"] == key:
-                option["enabled"] = not option["enabled"]
-                self._save_settings()  # Save settings when changed
-                return option["enabled"]
-        return False
+        option = self._help_options_by_key.get(key)
+        if option is None:
+            return False
+        option["enabled"] = not option["enabled"]
+        self._save_settings()  # Save settings when changed
+        return option["enabled"]
 
     def is_help_option_enabled(self, key: str) -> bool:
         """Check if a help option is enabled"""
         if key == "flip_board":
             return self.flip_board_enabled
 
-        for option in self.help_options:
-            if option["key"] == key:
-                return option["enabled"]
-        return False
+        option = self._help_options_by_key.get(key)
+        return option["enabled"] if option is not None else False
 
     def draw_move_indicator(self, screen, x: int, y: int) -> None:
         """Draw the pre-created move indicator at specified position"""
@@ -894,7 +1022,8 @@ class ChessDisplay:
         border_thickness = 4
 
         # Draw border on all four edges
-        border_rect = pygame.Rect(x, y, self.square_size, self.square_size)
+        border_rect = self._square_rect
+        border_rect.topleft = (x, y)
         pygame.draw.rect(screen, indicator_color, border_rect, border_thickness)
 
     def is_animation_active(self) -> bool:
@@ -904,8 +1033,7 @@ class ChessDisplay:
 
     def start_move_animation(self, from_square: chess.Square, to_square: chess.Square, piece: chess.Piece) -> None:
         """Start animating a move for navigation (undo/redo)"""
-        import time
-        self.move_animation_start_time = time.time()
+        self.move_animation_start_time = monotonic()
         self.move_animation_from_square = from_square
         self.move_animation_to_square = to_square
         self.move_animation_piece = piece
@@ -921,8 +1049,7 @@ class ChessDisplay:
 
     def start_checkmate_animation(self, board_state: BoardState) -> None:
         """Start the checkmate animation for the losing king"""
-        import time
-        self.checkmate_animation_start_time = time.time()
+        self.checkmate_animation_start_time = monotonic()
 
         # Find the checkmated king position
         losing_color = board_state.board.turn
@@ -933,8 +1060,7 @@ class ChessDisplay:
         if self.move_animation_start_time is None:
             return True
 
-        import time
-        elapsed_time = time.time() - self.move_animation_start_time
+        elapsed_time = monotonic() - self.move_animation_start_time
 
         # Check if animation is complete
         if elapsed_time >= self.move_animation_duration:
@@ -945,8 +1071,8 @@ class ChessDisplay:
         progress = elapsed_time / self.move_animation_duration
 
         # Get from/to coordinates
-        from_row, from_col = coords_from_square(self.move_animation_from_square)
-        to_row, to_col = coords_from_square(self.move_animation_to_square)
+        from_row, from_col = _COORDS_FROM_SQUARE[self.move_animation_from_square]
+        to_row, to_col = _COORDS_FROM_SQUARE[self.move_animation_to_square]
 
         # Apply board flip if needed
         if is_board_flipped:
@@ -962,11 +1088,9 @@ class ChessDisplay:
         screen_y = self.board_margin_y + int((current_row + 0.5) * self.square_size)
 
         # Draw the piece at the interpolated position
-        color_str = "w" if self.move_animation_piece.color == chess.WHITE else "b"
-        piece_key = f"{color_str}{self.move_animation_piece.piece_type}"
-
-        if piece_key in self.piece_images:
-            piece_image = self.piece_images[piece_key]
+        piece = self.move_animation_piece
+        piece_image = self.piece_images_by_ct[piece.color][piece.piece_type]
+        if piece_image is not None:
             # Center the piece image
             piece_rect = piece_image.get_rect(center=(screen_x, screen_y))
             screen.blit(piece_image, piece_rect)
@@ -980,20 +1104,22 @@ class ChessDisplay:
 
         if elapsed_time > animation_duration:
             # Animation finished, draw normally but upside down
-            angle = 180
+            step = _KING_ROTATION_STEPS
         else:
-            # Calculate rotation angle (0 to 180 degrees over 0.5 seconds)
+            # Rotation angle goes 0 to 180 degrees over 0.5 seconds, in pre-rotated steps
             progress = elapsed_time / animation_duration
-            angle = progress * 180
+            step = min(_KING_ROTATION_STEPS, int(progress * _KING_ROTATION_STEPS))
 
         # Get the original piece image
-        color_str = "w" if piece.color == chess.WHITE else "b"
-        key = f"{color_str}{piece.piece_type}"
-        if key in self.piece_images:
-            original_surface = self.piece_images[key]
-
-            # Rotate the image
-            rotated_surface = pygame.transform.rotate(original_surface, angle)
+        original_surface = self.piece_images_by_ct[piece.color][piece.piece_type]
+        if original_surface is not None:
+            # Rotations are built once per piece and square size, then looked up per frame
+            frames = self._rotated_piece_frames.get(piece)
+            if frames is None:
+                frames = [pygame.transform.rotate(original_surface, i * 180 / _KING_ROTATION_STEPS)
+                          for i in range(_KING_ROTATION_STEPS + 1)]
+                self._rotated_piece_frames[piece] = frames
+            rotated_surface = frames[step]
 
             # Center the rotated image in the square
             rotated_rect = rotated_surface.get_rect()
@@ -1005,7 +1131,7 @@ class ChessDisplay:
         else:
             # Fallback to text
             piece_text = chess.piece_symbol(piece.piece_type).upper() if piece.color == chess.WHITE else chess.piece_symbol(piece.piece_type)
-            text_surface = self.font_large.render(piece_text, True, self.RGB_BLACK)
+            text_surface = self._render_text(self.font_large, piece_text, self.RGB_BLACK)
             text_rect = text_surface.get_rect(center=(x + self.square_size//2, y + self.square_size//2))
             screen.blit(text_surface, text_rect)
 
@@ -1020,108 +1146,58 @@ class ChessDisplay:
         # Check if move animation is active (skip tactical calculations if so)
         is_animating_move = (self.move_animation_start_time is not None)
 
-        # Check if any highlighting is active (exchange or statistics)
-        has_exchange_highlights = False
-        has_statistics_highlights = False
+        # Highlight sets for this frame, each computed once and shared by the last-move check and the overlay pass
+        evaluation_board = preview_board_state if preview_board_state else board_state
+        exchange_highlight_set = None
+        statistics_highlight_set = None
 
-        if mouse_pos and not self.hovered_statistic and not is_animating_move:
-            evaluation_board = preview_board_state if preview_board_state else board_state
+        # Exchange evaluation highlights - only if NOT hovering over statistics (to avoid conflict)
+        if mouse_pos and not self.hovered_statistic:
             highlight_positions = self.get_exchange_highlights(mouse_pos, evaluation_board, is_board_flipped)
             if highlight_positions:
-                has_exchange_highlights = True
-
-        if self.hovered_statistic and not is_animating_move:
-            has_statistics_highlights = True
+                exchange_highlight_set = set(highlight_positions)
 
-        any_highlights_active = has_exchange_highlights or has_statistics_highlights
+        # Statistics highlights if hovering over spreadsheet
+        if self.hovered_statistic:
+            stat_type, player_side = self.hovered_statistic
+            highlight_items = self.get_highlighted_pieces_for_statistic(evaluation_board, stat_type, player_side, is_board_flipped)
+            if highlight_items:
+                statistics_highlight_set = set(highlight_items)
 
-        # Draw the board squares
-        for row in range(8):
-            for col in range(8):
-                # Apply flipping transformation
-                display_row = (7 - row) if is_board_flipped else row
-                display_col = (7 - col) if is_board_flipped else col
-                x = self.board_margin_x + display_col * self.square_size
-                y = self.board_margin_y + display_row * self.square_size
-
-                # Determine square color (use original coordinates for coloring)
-                is_light = (row + col) % 2 == 0
-                color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
-
-                # Apply last move highlighting (lichess-style green overlay) only if NO highlights are active
-                if board_state.last_move and not any_highlights_active:
-                    from_coords = coords_from_square(board_state.last_move.from_square)
-                    to_coords = coords_from_square(board_state.last_move.to_square)
-                    if (row, col) == from_coords or (row, col) == to_coords:
-                        color = Colors.LIGHT_SQUARE_LAST_MOVE if is_light else Colors.DARK_SQUARE_LAST_MOVE
-
-                # Highlight selected square only
-                if selected_square_coords and selected_square_coords == (row, col):
-                    color = self.SELECTED
-
-                # Draw the square
-                pygame.draw.rect(screen, color,
-                               (x, y, self.square_size, self.square_size))
-
-                # Draw piece glow BEFORE piece (so piece appears on top) - skip during move animation
-                square = square_from_coords(row, col)
-                evaluation_board = preview_board_state if preview_board_state else board_state
-
-                if not is_animating_move:
-                    # Check if piece is hanging (red glow)
-                    white_hanging = set(evaluation_board.get_hanging_pieces(chess.WHITE))
-                    black_hanging = set(evaluation_board.get_hanging_pieces(chess.BLACK))
-                    all_hanging = white_hanging | black_hanging
-
-                    if square in all_hanging:
-                        self.draw_hanging_indicator(screen, x, y)
-                    else:
-                        # Check if piece is attacked but not hanging (magenta glow)
-                        piece_at_square = evaluation_board.board.piece_at(square)
-                        if piece_at_square:
-                            enemy_color = not piece_at_square.color
-                            if evaluation_board.board.is_attacked_by(enemy_color, square):
-                                self.draw_attacked_indicator(screen, x, y)
-
-                # Draw piece if present (skip if being dragged or if being animated)
-                piece = board_state.board.piece_at(square)
-                skip_piece = (dragging_piece and drag_origin and (row, col) == drag_origin)
-
-                # Also skip piece if it's at the from or to square of the animation
-                if is_animating_move:
-                    from_coords = coords_from_square(self.move_animation_from_square)
-                    to_coords = coords_from_square(self.move_animation_to_square)
-                    if (row, col) == from_coords or (row, col) == to_coords:
-                        skip_piece = True
-
-                if piece and not skip_piece:
-                    self.draw_piece(screen, piece, x, y, row, col)
-
-                # Draw pin/skewer indicators AFTER piece (so they appear on top) - skip during move animation
-                if piece and not is_animating_move:
-                    white_pinned = set(evaluation_board.get_pinned_pieces(chess.WHITE))
-                    black_pinned = set(evaluation_board.get_pinned_pieces(chess.BLACK))
-                    all_pinned = white_pinned | black_pinned
-
-                    white_skewered = set(evaluation_board.get_skewered_pieces(chess.WHITE))
-                    black_skewered = set(evaluation_board.get_skewered_pieces(chess.BLACK))
-                    all_skewered = white_skewered | black_skewered
-
-                    if square in all_pinned:
-                        self.draw_pin_indicator(screen, x, y)
-                    elif square in all_skewered:
-                        self.draw_skewer_indicator(screen, x, y)
-
-                # Draw move indicator circle for possible moves
-                if (row, col) in highlighted_moves:
-                    self.draw_move_indicator(screen, x, y)
-
-                # Exchange evaluation triangles removed
+        # Check if any highlighting is active (exchange or statistics)
+        any_highlights_active = not is_animating_move and bool(exchange_highlight_set or self.hovered_statistic)
+
+        # Square positions come from the per-resize table (flipping already applied)
+        square_origins = self.square_origins[bool(is_board_flipped)]
+        square_size = self.square_size
+
+        # Draw the board squares: the prebuilt checkerboard, then the few recolored squares on top
+        screen.blit(self.board_background_surface, (self.board_margin_x, self.board_margin_y))
+
+        # Last move highlighting (lichess-style green) applies only if NO highlights are active
+        if board_state.last_move and not any_highlights_active:
+            for last_move_square in (board_state.last_move.from_square, board_state.last_move.to_square):
+                row, col = _COORDS_FROM_SQUARE[last_move_square]
+                x, y = square_origins[row * 8 + col]
+                screen.fill(self.square_colors[(row + col) & 1][1], (x, y, square_size, square_size))
+
+        # Highlight selected square only
+        if selected_square_coords:
+            row, col = selected_square_coords
+            x, y = square_origins[row * 8 + col]
+            screen.fill(self.selected_square_color, (x, y, square_size, square_size))
+
+        # The square pass is chosen once per frame: animation frames carry no tactical overlays
+        drag_coords = drag_origin if dragging_piece and drag_origin else None
+        if is_animating_move:
+            self._draw_squares_animated(screen, board_state, square_origins, highlighted_moves, drag_coords)
+        else:
+            self._draw_squares_with_tactics(screen, board_state, evaluation_board,
+                                            self.square_iteration[bool(is_board_flipped)],
+                                            highlighted_moves, drag_coords)
 
         # Draw fork indicators if enabled - skip during move animation
         if show_forks and not is_animating_move:
-            evaluation_board = preview_board_state if preview_board_state else board_state
-
             # Get fork opportunities for both colors
             white_forks = evaluation_board.get_fork_opportunities(chess.WHITE)
             black_forks = evaluation_board.get_fork_opportunities(chess.BLACK)
@@ -1129,61 +1205,17 @@ class ChessDisplay:
 
             # Draw arrows for each fork
             for fork in all_forks:
-                origin_coords = coords_from_square(fork['origin'])
-                dest_coords = coords_from_square(fork['destination'])
+                origin_coords = _COORDS_FROM_SQUARE[fork['origin']]
+                dest_coords = _COORDS_FROM_SQUARE[fork['destination']]
                 self.draw_fork_arrow(screen, origin_coords, dest_coords, is_board_flipped)
 
         # Draw exchange evaluation piece highlights (gray out non-highlighted) if hovering
-        # Only run if NOT hovering over statistics (to avoid conflict)
-        if mouse_pos and not self.hovered_statistic:
-            evaluation_board = preview_board_state if preview_board_state else board_state
-            highlight_positions = self.get_exchange_highlights(mouse_pos, evaluation_board, is_board_flipped)
-
-            if highlight_positions:
-                # Convert to set for fast lookup
-                highlight_set = set(highlight_positions)
-
-                # Draw gray overlay on ALL squares NOT in highlight set (both empty and occupied)
-                for row in range(8):
-                    for col in range(8):
-                        if (row, col) not in highlight_set:
-                            display_pos = self.get_square_display_position(row, col, is_board_flipped)
-                            if display_pos:
-                                x, y = display_pos
-                                self.draw_gray_overlay(screen, x, y)
-
-                # Draw thin white border around highlighted squares
-                for row, col in highlight_set:
-                    display_pos = self.get_square_display_position(row, col, is_board_flipped)
-                    if display_pos:
-                        x, y = display_pos
-                        pygame.draw.rect(screen, (255, 255, 255), (x, y, self.square_size, self.square_size), 2)
+        if exchange_highlight_set:
+            self._draw_highlight_overlay(screen, exchange_highlight_set, square_origins)
 
         # Draw statistics highlighting if hovering over spreadsheet (gray out non-highlighted)
-        if self.hovered_statistic:
-            stat_type, player_side = self.hovered_statistic
-            evaluation_board = preview_board_state if preview_board_state else board_state
-            highlight_items = self.get_highlighted_pieces_for_statistic(evaluation_board, stat_type, player_side, is_board_flipped)
-
-            if highlight_items:
-                # Convert to set for fast lookup
-                highlight_set = set(highlight_items)
-
-                # Draw gray overlay on ALL squares NOT in highlight set (both empty and occupied)
-                for row in range(8):
-                    for col in range(8):
-                        if (row, col) not in highlight_set:
-                            display_pos = self.get_square_display_position(row, col, is_board_flipped)
-                            if display_pos:
-                                x, y = display_pos
-                                self.draw_gray_overlay(screen, x, y)
-
-                # Draw thin white border around highlighted squares
-                for row, col in highlight_set:
-                    display_pos = self.get_square_display_position(row, col, is_board_flipped)
-                    if display_pos:
-                        x, y = display_pos
-                        pygame.draw.rect(screen, (255, 255, 255), (x, y, self.square_size, self.square_size), 2)
+        if statistics_highlight_set:
+            self._draw_highlight_overlay(screen, statistics_highlight_set, square_origins)
 
         # Draw board border (use actual board size based on squares)
         actual_board_size = self.square_size * 8
@@ -1201,10 +1233,88 @@ class ChessDisplay:
         if is_animating_move:
             self.draw_move_animation(screen, is_board_flipped)
 
+    def _draw_squares_with_tactics(self, screen, board_state: BoardState, evaluation_board: BoardState,
+                                   square_iteration: tuple, highlighted_moves: List[Tuple[int, int]],
+                                   drag_coords: Optional[Tuple[int, int]]) -> None:
+        """Draw pieces, tactical indicators and move dots for every square"""
+        # Tactical sets for the whole board, queried once before the square loop
+        # BITBOARD: Hanging, attacked, pinned and skewered pieces of both colors as single masks
+        hanging_bb = int(evaluation_board.get_hanging_pieces(chess.WHITE) |
+                         evaluation_board.get_hanging_pieces(chess.BLACK))
+        attacked_bb = int(evaluation_board.get_attacked_pieces(chess.WHITE) |
+                          evaluation_board.get_attacked_pieces(chess.BLACK))
+        pinned_bb = int(evaluation_board.get_pinned_pieces(chess.WHITE) |
+                        evaluation_board.get_pinned_pieces(chess.BLACK))
+        skewered_bb = int(evaluation_board.get_skewered_pieces(chess.WHITE) |
+                          evaluation_board.get_skewered_pieces(chess.BLACK))
+
+        piece_at = board_state.board.piece_at
+        for coords, square, square_bb, x, y in square_iteration:
+            # Draw piece glow BEFORE piece (so piece appears on top)
+            if hanging_bb & square_bb:
+                # Piece is hanging (red glow)
+                self.draw_hanging_indicator(screen, x, y)
+            elif attacked_bb & square_bb:
+                # Piece is attacked but not hanging (magenta glow)
+                self.draw_attacked_indicator(screen, x, y)
+
+            # Draw piece if present (skip if being dragged)
+            piece = piece_at(square)
+            if piece and coords != drag_coords:
+                self.draw_piece(screen, piece, x, y, *coords)
+
+            # Draw pin/skewer indicators AFTER piece (so they appear on top)
+            if piece:
+                if pinned_bb & square_bb:
+                    self.draw_pin_indicator(screen, x, y)
+                elif skewered_bb & square_bb:
+                    self.draw_skewer_indicator(screen, x, y)
+
+            # Draw move indicator circle for possible moves
+            if coords in highlighted_moves:
+                self.draw_move_indicator(screen, x, y)
+
+    def _draw_squares_animated(self, screen, board_state: BoardState, square_origins: tuple,
+                               highlighted_moves: List[Tuple[int, int]],
+                               drag_coords: Optional[Tuple[int, int]]) -> None:
+        """Draw pieces and move dots during a move animation - no tactical queries"""
+        # Pieces at the from and to squares of the animation are drawn by the animation itself
+        skipped = (drag_coords,
+                   _COORDS_FROM_SQUARE[self.move_animation_from_square],
+                   _COORDS_FROM_SQUARE[self.move_animation_to_square])
+
+        # BITBOARD: Visit occupied squares only
+        board = board_state.board
+        for square in chess.scan_forward(board.occupied):
+            coords = _COORDS_FROM_SQUARE[square]
+            if coords not in skipped:
+                row, col = coords
+                x, y = square_origins[row * 8 + col]
+                self.draw_piece(screen, board.piece_at(square), x, y, row, col)
+
+        # Draw move indicator circles for possible moves (promotions repeat a target square)
+        for row, col in set(highlighted_moves):
+            x, y = square_origins[row * 8 + col]
+            self.draw_move_indicator(screen, x, y)
+
+    def _draw_highlight_overlay(self, screen, highlight_set: set, square_origins: tuple) -> None:
+        """Gray out every square not in highlight_set and outline the highlighted ones"""
+        # Draw gray overlay on ALL squares NOT in highlight set (both empty and occupied)
+        for row in range(8):
+            for col in range(8):
+                if (row, col) not in highlight_set:
+                    x, y = square_origins[row * 8 + col]
+                    self.draw_gray_overlay(screen, x, y)
+
+        # Draw thin white border around highlighted squares
+        for row, col in highlight_set:
+            x, y = square_origins[row * 8 + col]
+            pygame.draw.rect(screen, (255, 255, 255), (x, y, self.square_size, self.square_size), 2)
+
     def draw_captured_pieces(self, screen, board_state: BoardState, is_board_flipped: bool, mouse_pos: Tuple[int, int] = None) -> None:
         """Draw captured pieces above or below the board"""
         # Miniature piece size (smaller than board pieces)
-        piece_size = self.square_size // 3
+        piece_size = self.captured_piece_size
 
         # Get captured pieces dynamically from board state
         captured_white, captured_black = board_state.get_captured_pieces()
@@ -1228,7 +1338,7 @@ class ChessDisplay:
 
         # Draw pieces above the board (with same margin as bottom)
         # pieces_above are captured white pieces (what black captured), so draw them as WHITE
-        y_above = self.board_margin_y - piece_size - 10
+        y_above = self.captured_y_above
         advantage_above = -advantage if not is_board_flipped else advantage  # Black's advantage
         self._draw_captured_pieces_row(screen, pieces_above, y_above, piece_size,
                                       chess.WHITE,  # Color of the captured pieces (white)
@@ -1238,8 +1348,7 @@ class ChessDisplay:
         # pieces_below are captured black pieces (what white captured), so draw them as BLACK
         # File letters are at: self.board_margin_y + self.board_size + 10
         # So captured pieces go below that with same spacing as top
-        coord_text_height = self.font_small.get_height()
-        y_below = self.board_margin_y + self.board_size + 10 + coord_text_height + 10
+        y_below = self.captured_y_below
         advantage_below = advantage if not is_board_flipped else -advantage  # White's advantage
         self._draw_captured_pieces_row(screen, pieces_below, y_below, piece_size,
                                       chess.BLACK,  # Color of the captured pieces (black)
@@ -1255,33 +1364,24 @@ class ChessDisplay:
         # Starting x position (left-aligned with board)
         x = self.board_margin_x
 
-        # Draw each captured piece
-        for piece_type in piece_types:
-            # Create a piece key for the image lookup (format: "w1" for white pawn, "b5" for black queen)
-            color_str = "w" if color == chess.WHITE else "b"
-            piece_key = f"{color_str}{piece_type}"
-
-            if piece_key in self.piece_images:
-                # Scale the piece image to miniature size (pawns 30% smaller)
-                original_image = self.piece_images[piece_key]
-                if piece_type == chess.PAWN:
-                    scaled_size = int(piece_size * 0.7)  # Pawns 30% smaller
-                    scaled_image = pygame.transform.smoothscale(original_image, (scaled_size, scaled_size))
-                    # Center pawn vertically
-                    piece_y = y + (piece_size - scaled_size) // 2
-                else:
-                    scaled_image = pygame.transform.smoothscale(original_image, (piece_size, piece_size))
-                    piece_y = y
+        # Miniatures are prebuilt per square size in _scale_piece_images
+        mini_images = self.mini_piece_images[color]
 
-                # Draw the piece
-                screen.blit(scaled_image, (x, piece_y))
+        # Lay out each captured piece, then draw the whole row in one blits() call
+        piece_blits = []
+        for piece_type in piece_types:
+            mini_image = mini_images[piece_type]
+            if mini_image is not None:
+                scaled_image, y_offset = mini_image
+                piece_blits.append((scaled_image, (x, y + y_offset)))
 
             x += piece_size + 5  # Space between pieces
+        screen.blits(piece_blits, doreturn=False)
 
         # Draw material advantage if positive
         if advantage > 0:
             advantage_text = f"+{advantage}"
-            advantage_surface = self.font_small.render(advantage_text, True, Colors.RGB_BLACK)
+            advantage_surface = self._render_text(self.font_small, advantage_text, Colors.RGB_BLACK)
             screen.blit(advantage_surface, (x + 5, y + (piece_size - advantage_surface.get_height()) // 2))
 
     def _draw_flip_and_help_buttons(self, screen, y: int, mouse_pos: Tuple[int, int] = None) -> None:
@@ -1299,8 +1399,8 @@ class ChessDisplay:
 
         if mouse_pos:
             # We need to create temp rects to check hover before drawing
-            flip_text_temp = self.font_small.render("Flip Board", True, Colors.RGB_BLACK)
-            help_text_temp = self.font_small.render("Help", True, Colors.RGB_BLACK)
+            flip_text_temp = self._render_text(self.font_small, "Flip Board", Colors.RGB_BLACK)
+            help_text_temp = self._render_text(self.font_small, "Help", Colors.RGB_BLACK)
             flip_button_width_temp = flip_text_temp.get_width() + 20
             help_button_width_temp = help_text_temp.get_width() + 20
             help_button_x_temp = stats_panel_right - help_button_width_temp - 10
@@ -1317,8 +1417,8 @@ class ChessDisplay:
         help_font = self.font_small_bold if help_is_hovered else self.font_small
 
         # Measure button text to determine widths
-        flip_text = flip_font.render("Flip Board", True, Colors.RGB_BLACK)
-        help_text = help_font.render("Help", True, Colors.RGB_BLACK)
+        flip_text = self._render_text(flip_font, "Flip Board", Colors.RGB_BLACK)
+        help_text = self._render_text(help_font, "Help", Colors.RGB_BLACK)
 
         flip_button_width = flip_text.get_width() + 20  # Add padding
         help_button_width = help_text.get_width() + 20  # Add padding
@@ -1374,18 +1474,15 @@ class ChessDisplay:
             piece.piece_type == chess.KING):
             # Check if this is the checkmated king's position
             if board_row != -1 and board_col != -1:
-                king_coords = coords_from_square(self.checkmate_king_position)
+                king_coords = _COORDS_FROM_SQUARE[self.checkmate_king_position]
                 if (board_row, board_col) == king_coords:
-                    import time
-                    elapsed_time = time.time() - self.checkmate_animation_start_time
+                    elapsed_time = monotonic() - self.checkmate_animation_start_time
                     self.draw_rotating_king(screen, piece, x, y, elapsed_time)
                     return
 
         # Normal piece drawing
-        color_str = "w" if piece.color == chess.WHITE else "b"
-        key = f"{color_str}{piece.piece_type}"
-        if key in self.piece_images:
-            piece_surface = self.piece_images[key]
+        piece_surface = self.piece_images_by_ct[piece.color][piece.piece_type]
+        if piece_surface is not None:
             # Center the piece in the square
             piece_x = x + (self.square_size - piece_surface.get_width()) // 2
             piece_y = y + (self.square_size - piece_surface.get_height()) // 2
@@ -1393,31 +1490,38 @@ class ChessDisplay:
         else:
             # Fallback: draw piece as text
             piece_text = chess.piece_symbol(piece.piece_type).upper() if piece.color == chess.WHITE else chess.piece_symbol(piece.piece_type)
-            text_surface = self.font_large.render(piece_text, True, self.RGB_BLACK)
+            text_surface = self._render_text(self.font_large, piece_text, self.RGB_BLACK)
             text_rect = text_surface.get_rect(center=(x + self.square_size//2, y + self.square_size//2))
             screen.blit(text_surface, text_rect)
     
     def draw_coordinates(self, screen, is_board_flipped: bool = False) -> None:
         """Draw board coordinates (a-h, 1-8)"""
-        # Draw file letters (a-h)
+        # Labels are rendered and placed once per layout; one blits() call draws all 16
+        screen.blits(self.coordinate_label_blits[bool(is_board_flipped)], doreturn=False)
+
+    def _create_coordinate_label_blits(self, is_board_flipped: bool) -> Tuple[Tuple[pygame.Surface, pygame.Rect], ...]:
+        """Render the 16 coordinate labels for one orientation with their screen positions"""
+        label_blits = []
+
+        # File letters (a-h)
         for col in range(8):
             letter = chr(ord('a') + (7 - col if is_board_flipped else col))
             x = self.board_margin_x + col * self.square_size + self.square_size // 2
             y = self.board_margin_y + self.board_size + 10
-            
+
             text_surface = self.font_small.render(letter, True, self.RGB_BLACK)
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
-        
-        # Draw rank numbers (1-8)
+            label_blits.append((text_surface, text_surface.get_rect(center=(x, y))))
+
+        # Rank numbers (1-8)
         for row in range(8):
             number = str((row + 1) if is_board_flipped else (8 - row))
             x = self.board_margin_x - 20
             y = self.board_margin_y + row * self.square_size + self.square_size // 2
-            
+
             text_surface = self.font_small.render(number, True, self.RGB_BLACK)
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
+            label_blits.append((text_surface, text_surface.get_rect(center=(x, y))))
+
+        return tuple(label_blits)
 
     def draw_activity_display(self, screen, board_state: BoardState, is_board_flipped: bool = False, force_recalculate: bool = False) -> None:
         """Draw activity scores underneath the board"""
@@ -1461,13 +1565,13 @@ class ChessDisplay:
             opponent_color = Colors.RGB_BLACK
 
         # Render text parts separately for color highlighting
-        label_surface = self.font_medium.render("Activity: ", True, Colors.RGB_BLACK)
+        label_surface = self._render_text(self.font_medium, "Activity: ", Colors.RGB_BLACK)
         # Use bold font for black (winning) scores, regular for grey (losing) scores
         player_font = self.font_medium_bold if player_color == Colors.RGB_BLACK else self.font_medium
         opponent_font = self.font_medium_bold if opponent_color == Colors.RGB_BLACK else self.font_medium
-        player_surface = player_font.render(str(player_activity), True, player_color)
-        space_surface = self.font_medium.render(" ", True, Colors.RGB_BLACK)
-        opponent_surface = opponent_font.render(str(opponent_activity), True, opponent_color)
+        player_surface = self._render_text(player_font, str(player_activity), player_color)
+        space_surface = self._render_text(self.font_medium, " ", Colors.RGB_BLACK)
+        opponent_surface = self._render_text(opponent_font, str(opponent_activity), opponent_color)
 
         # Calculate total width for centering
         total_width = (label_surface.get_width() + player_surface.get_width() +
@@ -1517,13 +1621,13 @@ class ChessDisplay:
             opponent_color = Colors.RGB_BLACK
 
         # Render text parts separately for color highlighting
-        label_surface = self.font_medium.render("Pawns: ", True, Colors.RGB_BLACK)
+        label_surface = self._render_text(self.font_medium, "Pawns: ", Colors.RGB_BLACK)
         # Use bold font for black (winning) scores, regular for grey (losing) scores
         player_font = self.font_medium_bold if player_color == Colors.RGB_BLACK else self.font_medium
         opponent_font = self.font_medium_bold if opponent_color == Colors.RGB_BLACK else self.font_medium
-        player_surface = player_font.render(str(player_pawns), True, player_color)
-        space_surface = self.font_medium.render(" ", True, Colors.RGB_BLACK)
-        opponent_surface = opponent_font.render(str(opponent_pawns), True, opponent_color)
+        player_surface = self._render_text(player_font, str(player_pawns), player_color)
+        space_surface = self._render_text(self.font_medium, " ", Colors.RGB_BLACK)
+        opponent_surface = self._render_text(opponent_font, str(opponent_pawns), opponent_color)
 
         # Calculate total width for centering
         total_width = (label_surface.get_width() + player_surface.get_width() +
@@ -1588,12 +1692,12 @@ class ChessDisplay:
                 opponent_color = Colors.RGB_BLACK
 
             # Render text parts: "Hanging: X Y" format
-            label_surface = self.font_medium.render(f"{stat_name}: ", True, Colors.RGB_BLACK)
+            label_surface = self._render_text(self.font_medium, f"{stat_name}: ", Colors.RGB_BLACK)
             player_font = self.font_medium_bold if player_color == Colors.RGB_BLACK else self.font_medium
             opponent_font = self.font_medium_bold if opponent_color == Colors.RGB_BLACK else self.font_medium
-            player_surface = player_font.render(str(player_count), True, player_color)
-            space_surface = self.font_medium.render(" ", True, Colors.RGB_BLACK)
-            opponent_surface = opponent_font.render(str(opponent_count), True, opponent_color)
+            player_surface = self._render_text(player_font, str(player_count), player_color)
+            space_surface = self._render_text(self.font_medium, " ", Colors.RGB_BLACK)
+            opponent_surface = self._render_text(opponent_font, str(opponent_count), opponent_color)
 
             # Calculate total width for centering
             total_width = (label_surface.get_width() + player_surface.get_width() +
@@ -1616,7 +1720,7 @@ class ChessDisplay:
         if color is None:
             color = self.RGB_BLACK
         
-        text_surface = font.render(text, True, color)
+        text_surface = self._render_text(font, text, color)
         screen.blit(text_surface, (x, y))
 
     def draw_exchange_indicator(self, screen, x: int, y: int) -> None:
@@ -1657,28 +1761,18 @@ class ChessDisplay:
         return surface
 
     def draw_hanging_indicator(self, screen, x: int, y: int) -> None:
-        """Draw a red gradient glow behind hanging pieces (uses cached surface)"""
-        # Create or reuse cached gradient surface
-        if self.hanging_glow_surface is None or self.hanging_glow_size != self.square_size:
-            self.hanging_glow_surface = self._create_hanging_glow_surface(self.square_size)
-            self.hanging_glow_size = self.square_size
-
-        # Blit the cached gradient
+        """Draw a red disk behind hanging pieces (uses cached surface)"""
+        # Surface is rebuilt by _calculate_dimensions whenever the square size changes
         screen.blit(self.hanging_glow_surface, (x, y))
 
     def draw_attacked_indicator(self, screen, x: int, y: int) -> None:
-        """Draw a yellow gradient glow behind attacked pieces (uses cached surface)"""
-        # Create or reuse cached gradient surface
-        if self.attacked_glow_surface is None or self.attacked_glow_size != self.square_size:
-            self.attacked_glow_surface = self._create_attacked_glow_surface(self.square_size)
-            self.attacked_glow_size = self.square_size
-
-        # Blit the cached gradient
+        """Draw a yellow disk behind attacked pieces (uses cached surface)"""
+        # Surface is rebuilt by _calculate_dimensions whenever the square size changes
         screen.blit(self.attacked_glow_surface, (x, y))
 
     def draw_pin_indicator(self, screen, x: int, y: int) -> None:
         """Draw a white circle with 'P' in the upper left corner of the square"""
-        corner_size = int(self.square_size * 0.5)  # 50% of square size (doubled from 25%)
+        corner_size = self.indicator_corner_size
 
         # Circle position in upper left corner
         circle_center_x = x + corner_size // 2
@@ -1688,16 +1782,14 @@ class ChessDisplay:
         # Draw white circle
         pygame.draw.circle(screen, (255, 255, 255), (circle_center_x, circle_center_y), circle_radius)
 
-        # Draw black 'P' in the center
-        font_size = int(circle_radius * 1.8)
-        font = pygame.font.Font(None, font_size)
-        text = font.render('P', True, (0, 0, 0))
+        # Draw black 'P' in the center (font sized once per window size)
+        text = self._render_text(self.indicator_font, 'P', (0, 0, 0))
         text_rect = text.get_rect(center=(circle_center_x, circle_center_y))
         screen.blit(text, text_rect)
 
     def draw_skewer_indicator(self, screen, x: int, y: int) -> None:
         """Draw a white circle with 'S' in the upper left corner of the square"""
-        corner_size = int(self.square_size * 0.5)  # 50% of square size (doubled from 25%)
+        corner_size = self.indicator_corner_size
 
         # Circle position in upper left corner
         circle_center_x = x + corner_size // 2
@@ -1707,21 +1799,33 @@ class ChessDisplay:
         # Draw white circle
         pygame.draw.circle(screen, (255, 255, 255), (circle_center_x, circle_center_y), circle_radius)
 
-        # Draw black 'S' in the center
-        font_size = int(circle_radius * 1.8)
-        font = pygame.font.Font(None, font_size)
-        text = font.render('S', True, (0, 0, 0))
+        # Draw black 'S' in the center (font sized once per window size)
+        text = self._render_text(self.indicator_font, 'S', (0, 0, 0))
         text_rect = text.get_rect(center=(circle_center_x, circle_center_y))
         screen.blit(text, text_rect)
 
     def draw_fork_arrow(self, screen, from_coords: Tuple[int, int], to_coords: Tuple[int, int], is_board_flipped: bool) -> None:
         """Draw an arrow from origin square to fork destination square"""
+        # Arrow surfaces depend only on the two squares and orientation - built once per board size
+        key = (from_coords, to_coords, bool(is_board_flipped))
+        arrow = self._fork_arrow_cache.get(key)
+        if arrow is None:
+            arrow = self._create_fork_arrow(from_coords, to_coords, is_board_flipped)
+            self._fork_arrow_cache[key] = arrow
+
+        if arrow is not None:
+            arrow_surface, arrow_pos = arrow
+            screen.blit(arrow_surface, arrow_pos)
+
+    def _create_fork_arrow(self, from_coords: Tuple[int, int], to_coords: Tuple[int, int],
+                           is_board_flipped: bool) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Create the transparent arrow surface for a fork and its screen position"""
         # Get display positions for both squares
         from_pos = self.get_square_display_position(from_coords[0], from_coords[1], is_board_flipped)
         to_pos = self.get_square_display_position(to_coords[0], to_coords[1], is_board_flipped)
 
         if not from_pos or not to_pos:
-            return
+            return None
 
         # Calculate center points of each square
         from_x, from_y = from_pos
@@ -1730,8 +1834,6 @@ class ChessDisplay:
         to_center = (to_x + self.square_size // 2, to_y + self.square_size // 2)
 
         # Create a transparent surface for the arrow
-        import math
-
         # Calculate bounding box for the arrow
         min_x = min(from_center[0], to_center[0]) - 50
         min_y = min(from_center[1], to_center[1]) - 50
@@ -1787,8 +1889,7 @@ class ChessDisplay:
         # Draw filled triangle for arrowhead on transparent surface
         pygame.draw.polygon(arrow_surface, arrow_color, [to_relative, point1, point2])
 
-        # Blit the transparent surface onto the screen
-        screen.blit(arrow_surface, (min_x, min_y))
+        return arrow_surface, (min_x, min_y)
 
     def draw_gray_overlay(self, screen, x: int, y: int) -> None:
         """Draw a semi-transparent gray overlay to dim non-highlighted squares"""
@@ -1824,11 +1925,11 @@ class ChessDisplay:
         attackers, defenders = board_state.get_all_attackers_and_defenders(chess_square)
 
         # Convert chess.Square back to (row, col) coordinates
-        attacker_coords = [coords_from_square(sq) for sq in attackers]
-        defender_coords = [coords_from_square(sq) for sq in defenders]
+        attacker_coords = [_COORDS_FROM_SQUARE[sq] for sq in attackers]
+        defender_coords = [_COORDS_FROM_SQUARE[sq] for sq in defenders]
 
         # Include the hovered square itself (the attacked/defended piece)
-        hovered_coords = coords_from_square(chess_square)
+        hovered_coords = _COORDS_FROM_SQUARE[chess_square]
 
         # Return all positions that should be highlighted
         return attacker_coords + defender_coords + [hovered_coords]
@@ -1894,10 +1995,17 @@ class ChessDisplay:
 
     def draw_stalemate_overlay(self, screen) -> None:
         """Draw a semi-transparent stalemate message overlay with rubber stamp effect"""
+        # The dim overlay and the stamp depend only on the layout - built once per window size
+        if self._stalemate_overlay_blits is None:
+            self._stalemate_overlay_blits = self._create_stalemate_overlay_blits()
+        screen.blits(self._stalemate_overlay_blits, doreturn=False)
+
+    def _create_stalemate_overlay_blits(self) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+        """Build the overlay, outline and stamp surfaces for the stalemate message, in drawing order"""
         # Create semi-transparent overlay
         overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 100))  # Semi-transparent black
-        screen.blit(overlay, (0, 0))
+        overlay_blits = [(overlay, (0, 0))]
 
         # Calculate board width for text sizing
         board_width = self.square_size * 8
@@ -1932,14 +2040,15 @@ class ChessDisplay:
         rotated_rect = rotated_surface.get_rect(center=(board_center_x, board_center_y))
         outline_rect = rotated_outline.get_rect(center=(board_center_x, board_center_y))
 
-        # Draw thick black outline for better visibility
+        # Thick black outline for better visibility
         for dx in [-4, -3, -2, -1, 0, 1, 2, 3, 4]:
             for dy in [-4, -3, -2, -1, 0, 1, 2, 3, 4]:
                 if dx != 0 or dy != 0:
-                    screen.blit(rotated_outline, (outline_rect.x + dx, outline_rect.y + dy))
+                    overlay_blits.append((rotated_outline, (outline_rect.x + dx, outline_rect.y + dy)))
 
-        # Draw main red text
-        screen.blit(rotated_surface, rotated_rect)
+        # Main red text on top
+        overlay_blits.append((rotated_surface, rotated_rect.topleft))
+        return tuple(overlay_blits)
 
     def draw_keyboard_shortcuts_panel(self, screen) -> None:
         """Draw a centered panel showing all keyboard shortcuts in cell/table format"""
@@ -2073,7 +2182,7 @@ class ChessDisplay:
             key = f"{color_str}{piece_type}"
             if key in self.piece_images:
                 # Scale the piece image to fit
-                piece_surface = pygame.transform.smoothscale(self.piece_images[key], (piece_size - 10, piece_size - 10))
+                piece_surface = self._get_resized_piece(key, piece_size - 10)
                 piece_x_centered = piece_x + (piece_size - piece_surface.get_width()) // 2
                 piece_y_centered = piece_y + (piece_size - piece_surface.get_height()) // 2
                 screen.blit(piece_surface, (piece_x_centered, piece_y_centered))
@@ -260,7 +260,7 @@ while is_running:
                     # Right: go forward one move
                     if game.can_redo() and len(game.redo_stack) > 0:
                         # Peek at the next move in redo stack
-                        next_board, next_history, next_last_move = game.redo_stack[-1]
+                        next_last_move = game.redo_stack[-1]
                         if next_last_move:
                             from_square = next_last_move.from_square
                             to_square = next_last_move.to_square
@@ -353,7 +353,7 @@ while is_running:
                 elif vcr_button == "forward":
                     # Animate redo
                     if game.can_redo() and len(game.redo_stack) > 0:
-                        next_board, next_history, next_last_move = game.redo_stack[-1]
+                        next_last_move = game.redo_stack[-1]
                         if next_last_move:
                             from_square = next_last_move.from_square
                             to_square = next_last_move.to_square